@@ -3,7 +3,7 @@
 包含企业卡、机会卡、金融卡、副业卡等各类投资卡片
 """
 
-from .base import Card, CardType, InvestmentCard
+from .base import Card, CardType, InvestmentCard, card_display_lines
 from .enterprise import EnterpriseCard
 from .opportunity import OpportunityCard
 from .financial import FinancialCard, FinancialAsset
@@ -11,7 +11,7 @@ from .side_business import SideBusinessCard
 from .card_manager import CardManager
 
 __all__ = [
-    'Card', 'CardType', 'InvestmentCard',
+    'Card', 'CardType', 'InvestmentCard', 'card_display_lines',
     'EnterpriseCard', 'OpportunityCard', 'FinancialCard', 'FinancialAsset',
     'SideBusinessCard', 'CardManager'
 ] 
\ No newline at end of file
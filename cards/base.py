@@ -81,6 +81,9 @@ class CardType(Enum):
 
 class Card(ABC):
     """卡片基类"""
+    # 界面上展示的字段：(标签, 属性名)，卡片没有的属性会被跳过
+    DISPLAY_FIELDS = (("成本", "cost"), ("首付", "down_payment"), ("月现金流", "monthly_cash_flow"))
+    
     def __init__(self, card_id, name, card_type, description):
         self.card_id = card_id
         self.name = name
@@ -135,4 +138,16 @@ class InvestmentCard(Card):
     def __str__(self):
         return (f"{self.type.value}: {self.name} - "
                 f"总价: {self.cost}, 首付: {self.down_payment}, "
-                f"月现金流: {self.monthly_cash_flow}") 
\ No newline at end of file
+                f"月现金流: {self.monthly_cash_flow}") 
+
+
+_MISSING = object()
+
+def card_display_lines(card):
+    """按DISPLAY_FIELDS生成卡片的展示行，如"成本: 5000"；卡片没有的属性跳过
+    
+    不在Card体系内的卡片（如RealEstateCard）使用Card.DISPLAY_FIELDS
+    """
+    fields = getattr(card, "DISPLAY_FIELDS", Card.DISPLAY_FIELDS)
+    return [f"{label}: {value}" for label, attr in fields
+            if (value := getattr(card, attr, _MISSING)) is not _MISSING]
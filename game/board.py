@@ -101,6 +101,19 @@ class Square(ABC):
     def __str__(self):
         return f"{self.type.value}: {self.name}"
 
+def inner_ring_step(position, is_moving_forward, steps):
+    """内圈往返移动：返回移动steps步后的(位置, 是否向前)
+    
+    往返路径周期为16：把(位置, 方向)展开成0..15的相位，
+    0..8对应向前的1..9，9..15对应向后的8..2。
+    不依赖棋盘实例，批量模拟掷骰时可直接调用。
+    """
+    phase = position - 1 if is_moving_forward else 17 - position
+    phase = (phase + steps) & 15
+    if phase <= 8:
+        return phase + 1, phase < 8
+    return 17 - phase, False
+
 class GameBoard:
     """游戏棋盘"""
     
@@ -299,18 +312,8 @@ class GameBoard:
                     position = current_position
                     is_moving_forward = position != 9  # 位置9向后移动，其他位置向前移动
                 
-                for _ in range(steps):
-                    if is_moving_forward:  # 向前移动(数字增大)
-                        position += 1
-                        if position == 9:  # 到达9后，下一步开始向后
-                            is_moving_forward = False
-                    else:  # 向后移动(数字减小)
-                        position -= 1
-                        if position == 1:  # 到达1后，下一步开始向前
-                            is_moving_forward = True
-                
                 # 为了兼容原有接口，只返回位置值，不返回方向
-                return position
+                return inner_ring_step(position, is_moving_forward, steps)[0]
             else:
                 # 其他层使用圆形模运算
                 return (current_position + steps) % len(self.circles[layer])
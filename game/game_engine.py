@@ -70,7 +70,7 @@
 import random
 from enum import Enum
 
-from .board import GameBoard
+from .board import GameBoard, SquareType
 from cards import CardManager
 from player import Player
 
@@ -219,7 +219,7 @@ class GameEngine:
         
         # 处理裁员状态
         if hasattr(current_player, 'downsized_turns') and current_player.downsized_turns > 0:
-            if square.type.value == "发薪水":
+            if square.type is SquareType.PAYCHECK:
                 current_player.downsized_turns -= 1
                 self.log(f"{current_player.name} 被裁员中，跳过工资收入。剩余 {current_player.downsized_turns} 回合")
                 self.turn_phase = TurnPhase.END_TURN
@@ -230,11 +230,11 @@ class GameEngine:
         self.log(event_result)
         
         # 根据格子类型决定下一阶段
-        if square.type.value == "机会" and self.current_opportunity_card:
+        if square.type is SquareType.OPPORTUNITY and self.current_opportunity_card:
             self.turn_phase = TurnPhase.CARD_DECISION
-        elif square.type.value == "市场" and self.market_mode:
+        elif square.type is SquareType.MARKET and self.market_mode:
             self.turn_phase = TurnPhase.MARKET
-        elif square.type.value == "层级转换" and self.layer_transition_active:
+        elif square.type is SquareType.LAYER_TRANSITION and self.layer_transition_active:
             self.turn_phase = TurnPhase.LAYER_TRANSITION
         else:
             self.turn_phase = TurnPhase.END_TURN
@@ -298,8 +298,7 @@ class GameEngine:
                     # 卖给银行
                     current_player.assets.remove(asset)
                     current_player.cash += price
-                    if hasattr(asset, 'passive_income'):
-                        current_player.passive_income -= asset.passive_income
+                    current_player.passive_income -= asset.passive_income
                     message = f"卖出资产 {asset.name}，获得 {price} 元"
                 
                 self.log(f"{current_player.name}: {message}")
@@ -534,14 +533,4 @@ class GameEngine:
     
     def get_recent_log(self, count=10):
         """获取最近的游戏日志"""
-        return self.game_log[-count:] if len(self.game_log) > count else self.game_log.copy()
-    
-    def save_game(self, filename):
-        """保存游戏状态"""
-        # 这里可以实现游戏保存功能
-        pass
-    
-    def load_game(self, filename):
-        """加载游戏状态"""
-        # 这里可以实现游戏加载功能
-        pass 
\ No newline at end of file
+        return self.game_log[-count:] if len(self.game_log) > count else self.game_log.copy() 
\ No newline at end of file
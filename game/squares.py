@@ -85,9 +85,16 @@
 """
 
 import random
+from bisect import bisect_left
 from .board import Square, SquareType
 from cards.base import CardType
 
+__all__ = [
+    'StartSquare', 'PaycheckSquare', 'OpportunitySquare', 'DoodadSquare',
+    'MarketSquare', 'CharitySquare', 'DownsizedSquare', 'BabySquare',
+    'LayerTransitionSquare'
+]
+
 class StartSquare(Square):
     """起始点格子"""
     
@@ -108,17 +115,8 @@ class PaycheckSquare(Square):
     
     def trigger_event(self, player, game_engine):
         """处理月收支"""
-        # 收取工资
-        player.receive_salary()
-        
-        # 收取被动收入
-        player.receive_passive_income()
-        
-        # 支付支出
-        player.pay_expenses()
-        
-        # 计算净收入
-        net_income = player.salary + player.passive_income - player.expenses
+        # 收取工资和被动收入，支付支出
+        net_income = player.end_of_turn()
         
         return (f"{player.name} 收支结算: "
                 f"工资 {player.salary} + 被动收入 {player.passive_income} "
@@ -127,18 +125,19 @@ class PaycheckSquare(Square):
 class OpportunitySquare(Square):
     """机会格子 - 抽取投资机会卡片"""
     
+    # 卡片类型及其累积概率（对应概率 0.2, 0.4, 0.3, 0.1，可以根据游戏规则调整）
+    _CARD_TYPES = (CardType.ENTERPRISE, CardType.OPPORTUNITY,
+                   CardType.FINANCIAL, CardType.SIDE_BUSINESS)
+    _CARD_CDF = (0.2, 0.6, 0.9, 1.0)
+    
     def __init__(self, name, position):
         super().__init__(name, SquareType.OPPORTUNITY, position)
         self.description = "抽取投资机会卡片"
     
     def trigger_event(self, player, game_engine):
         """抽取机会卡片"""
-        # 随机选择卡片类型（可以根据游戏规则调整概率）
-        card_types = [CardType.ENTERPRISE, CardType.OPPORTUNITY, 
-                     CardType.FINANCIAL, CardType.SIDE_BUSINESS]
-        weights = [0.2, 0.4, 0.3, 0.1]  # 不同卡片类型的出现概率
-        
-        card_type = random.choices(card_types, weights=weights)[0]
+        # 按累积概率随机选择卡片类型
+        card_type = self._CARD_TYPES[bisect_left(self._CARD_CDF, random.random())]
         card = game_engine.card_manager.draw_card(card_type)
         
         if card:
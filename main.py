@@ -52,32 +52,26 @@
 
 import sys
 import os
-import json
 import traceback
-import tkinter as tk
-from tkinter import ttk, messagebox
+from itertools import cycle, islice
+
+# tkinter在首次需要界面时才导入（见_import_tk），--help等命令行路径无需加载Tk
+tk = ttk = messagebox = None
 
 # 添加项目根目录到Python路径
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
+from player.professions import load_professions
+
 # 常量配置
 WINDOW_CONFIG = {
     'title': '财富流游戏启动器',
-    'geometry': '650x550',
+    'size': (650, 550),
     'min_size': (500, 400),
     'icon_title': '🎯 财富流游戏'
 }
 
-DEFAULT_PROFESSIONS = [
-    {"id": "engineer", "name": "工程师", "salary": 5000, "initial_cash": 10000, "initial_expenses": 2500},
-    {"id": "teacher", "name": "教师", "salary": 4000, "initial_cash": 8000, "initial_expenses": 2000},
-    {"id": "doctor", "name": "医生", "salary": 8000, "initial_cash": 15000, "initial_expenses": 4000},
-    {"id": "lawyer", "name": "律师", "salary": 7000, "initial_cash": 12000, "initial_expenses": 3500},
-    {"id": "manager", "name": "经理", "salary": 6000, "initial_cash": 11000, "initial_expenses": 3000},
-    {"id": "nurse", "name": "护士", "salary": 3500, "initial_cash": 7000, "initial_expenses": 1800}
-]
-
 GAME_INFO = """🎯 游戏目标：让你的被动收入超过月支出，实现财务自由！
 
 🎮 游戏流程：投骰子移动 → 处理格子事件 → 决定投资 → 管理资产
@@ -88,13 +82,19 @@ GAME_INFO = """🎯 游戏目标：让你的被动收入超过月支出，实现
 
 🏆 胜利条件：被动收入 >= 月支出时获得财务自由！"""
 
+def _import_tk():
+    """导入tkinter模块并绑定到模块级名称"""
+    global tk, ttk, messagebox
+    import tkinter as tk
+    from tkinter import ttk, messagebox
+
 def check_dependencies():
     """检查必要的依赖"""
     try:
-        import tkinter
+        _import_tk()
         return True
     except ImportError:
-        messagebox.showerror("错误", "缺少必要的依赖包：tkinter")
+        print("错误: 缺少必要的依赖包：tkinter")
         return False
 
 def ensure_data_dir():
@@ -107,6 +107,7 @@ class GameLauncher:
     """游戏启动器 - 简化版本"""
     
     def __init__(self):
+        _import_tk()
         self.root = self._setup_window()
         self.professions = self._load_professions()
         self._create_ui()
@@ -114,15 +115,16 @@ class GameLauncher:
     def _setup_window(self):
         """设置主窗口"""
         root = tk.Tk()
+        root.withdraw()  # 先隐藏，设置好位置后再显示，避免闪烁
         root.title(WINDOW_CONFIG['title'])
-        root.geometry(WINDOW_CONFIG['geometry'])
         root.minsize(*WINDOW_CONFIG['min_size'])  # 设置最小尺寸，允许调整大小
         
-        # 居中显示
-        root.update_idletasks()
-        x = (root.winfo_screenwidth() - 650) // 2
-        y = (root.winfo_screenheight() - 550) // 2
-        root.geometry(f"650x550+{x}+{y}")
+        # 居中显示（一次性设置尺寸和位置）
+        width, height = WINDOW_CONFIG['size']
+        x = (root.winfo_screenwidth() - width) // 2
+        y = (root.winfo_screenheight() - height) // 2
+        root.geometry(f"{width}x{height}+{x}+{y}")
+        root.deiconify()
         
         # 聚焦设置
         root.lift()
@@ -132,12 +134,7 @@ class GameLauncher:
     
     def _load_professions(self):
         """加载职业数据"""
-        try:
-            data_path = os.path.join(project_root, "data", "professions.json")
-            with open(data_path, 'r', encoding='utf-8') as f:
-                return json.load(f)['professions']
-        except Exception:
-            return DEFAULT_PROFESSIONS
+        return load_professions()
     
     def _create_ui(self):
         """创建用户界面"""
@@ -190,21 +187,9 @@ class GameLauncher:
         info_frame = ttk.LabelFrame(parent, text="游戏说明", padding="10")
         info_frame.pack(fill=tk.BOTH, expand=True)
         
-        # 创建可滚动的文本区域
-        text_widget = tk.Text(info_frame, wrap=tk.WORD, height=8, 
-                             font=("Arial", 9), state=tk.DISABLED)
-        scrollbar = ttk.Scrollbar(info_frame, orient=tk.VERTICAL, 
-                                 command=text_widget.yview)
-        text_widget.configure(yscrollcommand=scrollbar.set)
-        
-        # 插入文本
-        text_widget.configure(state=tk.NORMAL)
-        text_widget.insert(tk.END, GAME_INFO)
-        text_widget.configure(state=tk.DISABLED)
-        
-        # 布局
-        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # 静态说明文字使用Label显示，无需Text编辑器模型
+        ttk.Label(info_frame, text=GAME_INFO, wraplength=560, 
+                 justify=tk.LEFT, font=("Arial", 9)).pack(fill=tk.BOTH, expand=True)
     
     def start_game(self):
         """开始游戏"""
@@ -227,11 +212,11 @@ class GameLauncher:
         """创建快速开始的玩家"""
         return [{
             'name': f"玩家{i+1}",
-            'profession': self.professions[i % len(self.professions)]['name'],
-            'salary': self.professions[i % len(self.professions)]['salary'],
-            'cash': self.professions[i % len(self.professions)]['initial_cash'],
-            'expenses': self.professions[i % len(self.professions)]['initial_expenses']
-        } for i in range(count)]
+            'profession': profession['name'],
+            'salary': profession['salary'],
+            'cash': profession['initial_cash'],
+            'expenses': profession['initial_expenses']
+        } for i, profession in enumerate(islice(cycle(self.professions), count))]
     
     def _get_detailed_setup(self, count):
         """获取详细玩家设置"""
@@ -280,19 +265,24 @@ class PlayerSetupDialog:
     def __init__(self, parent, professions, player_count):
         self.result = None
         self.professions = professions
+        self._prof_by_name = {p['name']: p for p in professions}
+        # 职业名称只在这里生成一次，所有玩家的下拉框共用
+        self._prof_names = tuple(p['name'] for p in professions)
         
         self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()  # 先隐藏，布局完成后再显示
         self.dialog.title("玩家设置")
-        self.dialog.geometry("450x350")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
         
         self._center_dialog()
         self._create_dialog_ui(player_count)
+        
+        # grab_set要求窗口可见，因此在deiconify之后调用
+        self.dialog.deiconify()
+        self.dialog.grab_set()
     
     def _center_dialog(self):
         """居中显示对话框"""
-        self.dialog.update_idletasks()
         x = (self.dialog.winfo_screenwidth() - 450) // 2
         y = (self.dialog.winfo_screenheight() - 350) // 2
         self.dialog.geometry(f"450x350+{x}+{y}")
@@ -317,7 +307,7 @@ class PlayerSetupDialog:
         
         # 创建玩家输入区域
         self.player_entries = []
-        prof_names = [p['name'] for p in self.professions]
+        prof_names = self._prof_names
         
         for i in range(player_count):
             frame = ttk.LabelFrame(scrollable_frame, text=f"玩家 {i+1}", padding="8")
@@ -353,26 +343,25 @@ class PlayerSetupDialog:
     
     def _confirm(self):
         """确认设置"""
-        self.result = []
+        # 一次性读取所有输入
+        raw = [(entry['name'].get().strip(), entry['profession'].get())
+               for entry in self.player_entries]
         
-        for entry in self.player_entries:
-            name = entry['name'].get().strip()
-            prof_name = entry['profession'].get()
-            
-            if not name:
-                messagebox.showerror("错误", "请填写所有玩家的姓名")
-                return
-            
-            profession = next((p for p in self.professions if p['name'] == prof_name), 
-                            self.professions[0])
-            
-            self.result.append({
-                'name': name,
-                'profession': profession['name'],
-                'salary': profession['salary'],
-                'cash': profession['initial_cash'],
-                'expenses': profession['initial_expenses']
-            })
+        empty_index = next((i for i, (name, _) in enumerate(raw) if not name), None)
+        if empty_index is not None:
+            messagebox.showerror("错误", f"请填写玩家 {empty_index + 1} 的姓名")
+            return
+        
+        default_profession = self.professions[0]
+        professions = [self._prof_by_name.get(prof_name, default_profession) 
+                       for _, prof_name in raw]
+        self.result = [{
+            'name': name,
+            'profession': profession['name'],
+            'salary': profession['salary'],
+            'cash': profession['initial_cash'],
+            'expenses': profession['initial_expenses']
+        } for (name, _), profession in zip(raw, professions)]
         
         self.dialog.destroy()
     
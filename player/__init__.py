@@ -4,7 +4,9 @@
 """
 
 from .player import Player, Asset, Liability, FinancialAsset
+from .professions import load_professions, DEFAULT_PROFESSIONS
 
 __all__ = [
-    'Player', 'Asset', 'Liability', 'FinancialAsset'
+    'Player', 'Asset', 'Liability', 'FinancialAsset',
+    'load_professions', 'DEFAULT_PROFESSIONS'
 ] 
\ No newline at end of file
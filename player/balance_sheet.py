@@ -3,9 +3,30 @@ Balance Sheet (资产负债表) Module
 Manages player assets and liabilities tracking for the cash flow game
 """
 
+import json
+import sys
+from itertools import chain
+
+# Fixed liabilities and their display names, in statement order
+_FIXED_LIABILITY_LABELS = (
+    ("home_mortgage", "自住房抵押贷款"),
+    ("car_loan", "购车贷款"),
+    ("credit_card_debt", "信用卡负债"),
+    ("additional_debt", "额外负债"),
+    ("bank_loans", "银行贷款")
+)
+_FIXED_LIABILITY_KEYS = tuple(key for key, _ in _FIXED_LIABILITY_LABELS)
+
+def _copy_entries(items):
+    """Copy a {code: entry} mapping one level deep, so later edits by the caller don't reach it"""
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in items.items()}
+
 class BalanceSheet:
     """Balance Sheet class for tracking player assets and liabilities"""
     
+    __slots__ = ("assets", "_fixed_liabilities", "_debts",
+                 "_assets_total", "_liabilities_total")
+    
     def __init__(self):
         # Initialize assets structure
         self.assets = {
@@ -25,38 +46,90 @@ class BalanceSheet:
             "enterprise_investments": {}
         }
         
-        # Initialize liabilities structure
-        self.liabilities = {
-            # Home mortgage (自住房抵押贷款)
-            "home_mortgage": {"amount": 0},
-            
-            # Car loan (购车贷款)
-            "car_loan": {"amount": 0},
-            
-            # Credit card debt (信用卡负债)
-            "credit_card_debt": {"amount": 0},
-            
-            # Additional debt (额外负债)
-            "additional_debt": {"amount": 0},
-            
+        # Initialize fixed liabilities as flat amounts (see _FIXED_LIABILITY_LABELS)
+        self._fixed_liabilities = dict.fromkeys(_FIXED_LIABILITY_KEYS, 0)
+        
+        # Initialize per-item liabilities
+        self._debts = {
             # Real estate mortgages (房产抵押贷款)
             "real_estate_mortgages": {},
             
             # Enterprise debts (企业负债)
-            "enterprise_debts": {},
-            
-            # Bank loans (银行贷款)
-            "bank_loans": {"amount": 0}
+            "enterprise_debts": {}
+        }
+        
+        # Running totals, kept in sync by every mutator below
+        self._assets_total = 0
+        self._liabilities_total = 0
+    
+    @property
+    def liabilities(self):
+        """Nested liabilities view, with {"amount": x} wrappers for fixed liabilities
+        
+        Read-only: the outer dict and the fixed-liability wrappers are rebuilt on
+        every access, so writing to them (e.g. liabilities["car_loan"]["amount"] = x)
+        changes nothing. Use set_liability / add_real_estate_mortgage /
+        add_enterprise_debt, which also keep the cached total in sync.
+        """
+        fixed = self._fixed_liabilities
+        return {
+            "home_mortgage": {"amount": fixed["home_mortgage"]},
+            "car_loan": {"amount": fixed["car_loan"]},
+            "credit_card_debt": {"amount": fixed["credit_card_debt"]},
+            "additional_debt": {"amount": fixed["additional_debt"]},
+            "real_estate_mortgages": self._debts["real_estate_mortgages"],
+            "enterprise_debts": self._debts["enterprise_debts"],
+            "bank_loans": {"amount": fixed["bank_loans"]}
         }
     
+    def _put_asset(self, category, code, entry, value_key):
+        """Insert or replace an asset entry and adjust the cached total"""
+        investments = self.assets[category]
+        if code in investments:
+            self._assets_total -= investments[code][value_key]
+        investments[code] = entry
+        self._assets_total += entry[value_key]
+    
+    def _remove_asset(self, category, code, value_key):
+        """Remove an asset entry and adjust the cached total"""
+        entry = self.assets[category].pop(code, None)
+        if entry is not None:
+            self._assets_total -= entry[value_key]
+    
+    def _put_liability(self, category, code, amount):
+        """Insert or replace a liability entry and adjust the cached total"""
+        debts = self._debts[category]
+        if code in debts:
+            self._liabilities_total -= debts[code]["amount"]
+        debts[code] = {"amount": amount}
+        self._liabilities_total += amount
+    
+    def _recompute(self):
+        """Rebuild the cached totals from scratch (used after bulk loads)"""
+        assets = self.assets
+        self._assets_total = (
+            assets["bank_deposits"]["amount"]
+            + sum(stock["total_value"] for stock in assets["stock_investments"].values())
+            + sum(investment["equity"] for investment in chain(
+                assets["awareness_investments"].values(),
+                assets["real_estate_investments"].values(),
+                assets["enterprise_investments"].values()))
+        )
+        
+        self._liabilities_total = (
+            sum(self._fixed_liabilities.values())
+            + sum(debt["amount"] for debt in chain(
+                self._debts["real_estate_mortgages"].values(),
+                self._debts["enterprise_debts"].values()))
+        )
+    
     def add_awareness_investment(self, name, equity):
         """Add awareness investment"""
-        self.assets["awareness_investments"][name] = {"equity": equity}
+        self._put_asset("awareness_investments", name, {"equity": equity}, "equity")
     
     def remove_awareness_investment(self, name):
         """Remove awareness investment"""
-        if name in self.assets["awareness_investments"]:
-            del self.assets["awareness_investments"][name]
+        self._remove_asset("awareness_investments", name, "equity")
     
     def update_data(self, asset_data=None, liability_data=None):
         """更新资产负债表数据 - 为了兼容player.py中的调用"""
@@ -78,109 +151,103 @@ class BalanceSheet:
                 if isinstance(data, dict) and "金额" in data:
                     amount = data["金额"]
                     if liability_type == "自住房抵押贷款":
-                        self.set_home_mortgage(amount)
+                        self.set_liability("home_mortgage", amount)
                     elif liability_type == "购车贷款":
-                        self.set_car_loan(amount)
+                        self.set_liability("car_loan", amount)
                     elif liability_type == "信用卡负债":
-                        self.set_credit_card_debt(amount)
+                        self.set_liability("credit_card_debt", amount)
     
     def get_data(self):
         """获取完整的资产负债表数据"""
+        total_assets = self.get_total_assets()
+        total_liabilities = self.get_total_liabilities()
         return {
             "资产": self.assets,
             "负债": self.liabilities,
-            "总资产": self.get_total_assets(),
-            "总负债": self.get_total_liabilities(),
-            "净资产": self.get_net_worth()
+            "总资产": total_assets,
+            "总负债": total_liabilities,
+            "净资产": total_assets - total_liabilities
         }
     
     def print_summary(self):
         """打印资产负债表摘要"""
-        print(f"总资产: {self.get_total_assets():,}")
-        print(f"总负债: {self.get_total_liabilities():,}")
-        print(f"净资产: {self.get_net_worth():,}")
+        total_assets = self.get_total_assets()
+        total_liabilities = self.get_total_liabilities()
+        lines = [
+            f"总资产: {total_assets:,}",
+            f"总负债: {total_liabilities:,}",
+            f"净资产: {total_assets - total_liabilities:,}"
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def set_bank_deposits(self, amount):
         """Set bank deposit amount"""
-        self.assets["bank_deposits"]["amount"] = amount
+        bank_deposits = self.assets["bank_deposits"]
+        self._assets_total += amount - bank_deposits["amount"]
+        bank_deposits["amount"] = amount
     
     def add_stock_investment(self, code, cost_per_share, shares):
         """Add stock investment"""
-        self.assets["stock_investments"][code] = {
+        self._put_asset("stock_investments", code, {
             "cost_per_share": cost_per_share,
             "shares": shares,
             "total_value": cost_per_share * shares
-        }
+        }, "total_value")
     
     def remove_stock_investment(self, code):
         """Remove stock investment"""
-        if code in self.assets["stock_investments"]:
-            del self.assets["stock_investments"][code]
+        self._remove_asset("stock_investments", code, "total_value")
+    
+    def update_stock_shares(self, code, shares):
+        """Update the share count of a held stock"""
+        stock = self.assets["stock_investments"].get(code)
+        if stock is not None:
+            self._set_stock_value(stock, stock["cost_per_share"], shares)
+    
+    def update_stock_price(self, code, cost_per_share):
+        """Update the per-share cost of a held stock"""
+        stock = self.assets["stock_investments"].get(code)
+        if stock is not None:
+            self._set_stock_value(stock, cost_per_share, stock["shares"])
+    
+    def _set_stock_value(self, stock, cost_per_share, shares):
+        """Recompute a stock's total_value once and adjust the cached total"""
+        total_value = cost_per_share * shares
+        self._assets_total += total_value - stock["total_value"]
+        stock["cost_per_share"] = cost_per_share
+        stock["shares"] = shares
+        stock["total_value"] = total_value
     
     def add_real_estate_investment(self, code, equity):
         """Add real estate investment asset"""
-        self.assets["real_estate_investments"][code] = {"equity": equity}
+        self._put_asset("real_estate_investments", code, {"equity": equity}, "equity")
     
     def add_real_estate_mortgage(self, code, amount):
         """Add real estate mortgage liability"""
-        self.liabilities["real_estate_mortgages"][code] = {"amount": amount}
+        self._put_liability("real_estate_mortgages", code, amount)
     
     def add_enterprise_investment(self, code, equity):
         """Add enterprise investment asset"""
-        self.assets["enterprise_investments"][code] = {"equity": equity}
+        self._put_asset("enterprise_investments", code, {"equity": equity}, "equity")
     
     def add_enterprise_debt(self, code, amount):
         """Add enterprise debt liability"""
-        self.liabilities["enterprise_debts"][code] = {"amount": amount}
+        self._put_liability("enterprise_debts", code, amount)
     
     def set_liability(self, liability_type, amount):
         """Set specific liability amount"""
-        if liability_type in self.liabilities:
-            self.liabilities[liability_type]["amount"] = amount
+        fixed = self._fixed_liabilities
+        if liability_type in fixed:
+            self._liabilities_total += amount - fixed[liability_type]
+            fixed[liability_type] = amount
     
     def get_total_assets(self):
         """Calculate total assets"""
-        total = 0
-        
-        # Awareness investments
-        for investment in self.assets["awareness_investments"].values():
-            total += investment["equity"]
-        
-        # Bank deposits
-        total += self.assets["bank_deposits"]["amount"]
-        
-        # Stock investments
-        for stock in self.assets["stock_investments"].values():
-            total += stock["total_value"]
-        
-        # Real estate investments
-        for investment in self.assets["real_estate_investments"].values():
-            total += investment["equity"]
-        
-        # Enterprise investments
-        for investment in self.assets["enterprise_investments"].values():
-            total += investment["equity"]
-        
-        return total
+        return self._assets_total
     
     def get_total_liabilities(self):
         """Calculate total liabilities"""
-        total = 0
-        
-        # Fixed liabilities
-        for liability_type in ["home_mortgage", "car_loan", "credit_card_debt", 
-                             "additional_debt", "bank_loans"]:
-            total += self.liabilities[liability_type]["amount"]
-        
-        # Real estate mortgages
-        for mortgage in self.liabilities["real_estate_mortgages"].values():
-            total += mortgage["amount"]
-        
-        # Enterprise debts
-        for debt in self.liabilities["enterprise_debts"].values():
-            total += debt["amount"]
-        
-        return total
+        return self._liabilities_total
     
     def get_net_worth(self):
         """Calculate net worth (assets - liabilities)"""
@@ -188,66 +255,63 @@ class BalanceSheet:
     
     def print_statement(self):
         """Print formatted balance sheet"""
-        print("=== 资产负债表 (Balance Sheet) ===")
+        lines = []
+        lines.append("=== 资产负债表 (Balance Sheet) ===")
         
         # Assets
-        print("\n资产 (Assets):")
+        lines.append("\n资产 (Assets):")
         
         if self.assets["awareness_investments"]:
-            print("  觉察投资:")
+            lines.append("  觉察投资:")
             for name, data in self.assets["awareness_investments"].items():
-                print(f"    {name}: {data['equity']:,}元")
+                lines.append(f"    {name}: {data['equity']:,}元")
         
         bank_amount = self.assets["bank_deposits"]["amount"]
         if bank_amount > 0:
-            print(f"  银行存款: {bank_amount:,}元")
+            lines.append(f"  银行存款: {bank_amount:,}元")
         
         if self.assets["stock_investments"]:
-            print("  股票投资:")
+            lines.append("  股票投资:")
             for code, data in self.assets["stock_investments"].items():
-                print(f"    {code}: {data['shares']:,}股 @ {data['cost_per_share']:,}元 = {data['total_value']:,}元")
+                lines.append(f"    {code}: {data['shares']:,}股 @ {data['cost_per_share']:,}元 = {data['total_value']:,}元")
         
         if self.assets["real_estate_investments"]:
-            print("  房地产投资:")
+            lines.append("  房地产投资:")
             for code, data in self.assets["real_estate_investments"].items():
-                print(f"    {code}: {data['equity']:,}元")
+                lines.append(f"    {code}: {data['equity']:,}元")
         
         if self.assets["enterprise_investments"]:
-            print("  企业投资:")
+            lines.append("  企业投资:")
             for code, data in self.assets["enterprise_investments"].items():
-                print(f"    {code}: {data['equity']:,}元")
+                lines.append(f"    {code}: {data['equity']:,}元")
         
-        print(f"\n总资产: {self.get_total_assets():,}元")
+        total_assets = self.get_total_assets()
+        lines.append(f"\n总资产: {total_assets:,}元")
         
         # Liabilities
-        print("\n负债 (Liabilities):")
+        lines.append("\n负债 (Liabilities):")
         
-        for liability_type, chinese_name in [
-            ("home_mortgage", "自住房抵押贷款"),
-            ("car_loan", "购车贷款"),
-            ("credit_card_debt", "信用卡负债"),
-            ("additional_debt", "额外负债"),
-            ("bank_loans", "银行贷款")
-        ]:
-            amount = self.liabilities[liability_type]["amount"]
+        for liability_type, chinese_name in _FIXED_LIABILITY_LABELS:
+            amount = self._fixed_liabilities[liability_type]
             if amount > 0:
-                print(f"  {chinese_name}: {amount:,}元")
+                lines.append(f"  {chinese_name}: {amount:,}元")
         
-        if self.liabilities["real_estate_mortgages"]:
-            print("  房产抵押贷款:")
-            for code, data in self.liabilities["real_estate_mortgages"].items():
-                print(f"    {code}: {data['amount']:,}元")
+        if self._debts["real_estate_mortgages"]:
+            lines.append("  房产抵押贷款:")
+            for code, data in self._debts["real_estate_mortgages"].items():
+                lines.append(f"    {code}: {data['amount']:,}元")
         
-        if self.liabilities["enterprise_debts"]:
-            print("  企业负债:")
-            for code, data in self.liabilities["enterprise_debts"].items():
-                print(f"    {code}: {data['amount']:,}元")
+        if self._debts["enterprise_debts"]:
+            lines.append("  企业负债:")
+            for code, data in self._debts["enterprise_debts"].items():
+                lines.append(f"    {code}: {data['amount']:,}元")
         
         total_liabilities = self.get_total_liabilities()
-        net_worth = self.get_net_worth()
+        net_worth = total_assets - total_liabilities
         
-        print(f"\n总负债: {total_liabilities:,}元")
-        print(f"净资产: {net_worth:,}元")
+        lines.append(f"\n总负债: {total_liabilities:,}元")
+        lines.append(f"净资产: {net_worth:,}元")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def get_debt_to_asset_ratio(self):
         """Calculate debt to asset ratio"""
@@ -259,41 +323,63 @@ class BalanceSheet:
     def get_investment_breakdown(self):
         """Get breakdown of investments by type"""
         breakdown = {}
-        total_assets = self.get_total_assets()
-        
-        if total_assets == 0:
-            return breakdown
         
-        # Calculate percentages
+        # Category subtotals; their sum is the total asset value
         awareness_total = sum(inv["equity"] for inv in self.assets["awareness_investments"].values())
         stock_total = sum(stock["total_value"] for stock in self.assets["stock_investments"].values())
         real_estate_total = sum(inv["equity"] for inv in self.assets["real_estate_investments"].values())
         enterprise_total = sum(inv["equity"] for inv in self.assets["enterprise_investments"].values())
         cash_total = self.assets["bank_deposits"]["amount"]
+        total_assets = awareness_total + stock_total + real_estate_total + enterprise_total + cash_total
+        
+        if total_assets == 0:
+            return breakdown
         
+        # Calculate percentages (one division, then a multiply per category)
+        scale = 100.0 / total_assets
         breakdown = {
-            "觉察投资": (awareness_total, awareness_total / total_assets * 100),
-            "股票投资": (stock_total, stock_total / total_assets * 100),
-            "房地产投资": (real_estate_total, real_estate_total / total_assets * 100),
-            "企业投资": (enterprise_total, enterprise_total / total_assets * 100),
-            "现金": (cash_total, cash_total / total_assets * 100)
+            "觉察投资": (awareness_total, awareness_total * scale),
+            "股票投资": (stock_total, stock_total * scale),
+            "房地产投资": (real_estate_total, real_estate_total * scale),
+            "企业投资": (enterprise_total, enterprise_total * scale),
+            "现金": (cash_total, cash_total * scale)
         }
         
         return breakdown
     
     def to_dict(self):
-        """Convert to dictionary for serialization"""
+        """Convert to dictionary for serialization (shares the live asset/debt dicts)"""
         return {
             "assets": self.assets,
             "liabilities": self.liabilities
         }
     
     def from_dict(self, data):
-        """Load from dictionary"""
+        """Load from dictionary - nested entries are copied, data is not retained"""
         if "assets" in data:
-            self.assets = data["assets"]
+            self.assets = {
+                category: _copy_entries(items) for category, items in data["assets"].items()
+            }
         if "liabilities" in data:
-            self.liabilities = data["liabilities"]
+            liabilities = data["liabilities"]
+            for liability_type in _FIXED_LIABILITY_KEYS:
+                if liability_type in liabilities:
+                    self._fixed_liabilities[liability_type] = liabilities[liability_type]["amount"]
+            for category in self._debts:
+                if category in liabilities:
+                    self._debts[category] = _copy_entries(liabilities[category])
+        self._recompute()
+    
+    def to_json_bytes(self):
+        """Serialize to compact UTF-8 JSON - use this for snapshots instead of deep-copying to_dict()"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    @classmethod
+    def from_json_bytes(cls, data):
+        """Create a balance sheet from to_json_bytes() output"""
+        balance_sheet = cls()
+        balance_sheet.from_dict(json.loads(data))
+        return balance_sheet
 
 if __name__ == "__main__":
     # Test the balance sheet
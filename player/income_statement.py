@@ -3,130 +3,232 @@ Income Statement (损益表) Module
 Manages player income and expense tracking for the cash flow game
 """
 
+import sys
+
+# Chinese keys read by update_data
+_ACTIVE_CN = "主动收入"
+_WORK_CN = "工作收入"
+_PERSONAL_SALARY_CN = "本人工资"
+_CASHFLOW_CN = "现金流"
+
 class IncomeStatement:
     """Income Statement class for tracking player financial flows"""
     
+    # Fixed expense schema: slot index of each line in _expense_vec.
+    # The first three slots are the living expenses.
+    EXPENSE_SLOTS = {
+        "children": 0, "personal": 1, "spouse": 2,
+        "taxes": 3, "home_mortgage": 4, "rent": 5, "car_loan": 6,
+        "credit_card": 7, "additional_debt": 8, "insurance": 9,
+        "health": 10, "bank_loan_interest": 11
+    }
+    _LIVING_SLOTS = 3
+    _OTHER_EXPENSE_KEYS = ("taxes", "home_mortgage", "rent", "car_loan",
+                           "credit_card", "additional_debt", "insurance",
+                           "health", "bank_loan_interest")
+    
     def __init__(self):
-        # Initialize income structure
-        self.income = {
-            # Active Income (主动收入)
+        # Active Income (主动收入): flat cashflow stores
+        self._work_income = {"personal_salary": 0, "spouse_salary": 0}
+        self._side_businesses = {}      # code -> cashflow
+        
+        # Passive Income (被动收入): cashflows and their details kept side by side,
+        # one flat code -> value map per category
+        self._passive_cashflows = {"financial": {}, "real_estate": {}, "enterprise": {}}
+        self._passive_details = {"financial": {}, "real_estate": {}, "enterprise": {}}
+        
+        # Expenses: one fixed slot per line item, see EXPENSE_SLOTS
+        self._expense_vec = [0] * len(self.EXPENSE_SLOTS)
+        self._children_count = 0
+        self._cost_per_child = 0
+        self._living_total = 0          # sum of the three living-expense slots
+        
+        # Running totals, kept in sync by every mutator below
+        self._total_active = 0
+        self._passive_sums = {"financial": 0, "real_estate": 0, "enterprise": 0}
+        self._total_expenses = 0
+        
+        # get_data() result, rebuilt only after a mutator has run
+        self._dirty = True
+        self._cached_data = None
+    
+    @property
+    def income(self):
+        """Nested income view, materialized from the flat stores"""
+        details = self._passive_details
+        return {
             "active_income": {
                 "work_income": {
-                    "personal_salary": {"cashflow": 0},
-                    "spouse_salary": {"cashflow": 0}
+                    "personal_salary": {"cashflow": self._work_income["personal_salary"]},
+                    "spouse_salary": {"cashflow": self._work_income["spouse_salary"]}
                 },
-                "side_business_income": {}  # Will be populated with side business data
+                "side_business_income": {
+                    code: {"cashflow": cashflow}
+                    for code, cashflow in self._side_businesses.items()
+                }
             },
-            # Passive Income (被动收入)
             "passive_income": {
-                "financial": {},        # Financial investments
-                "real_estate": {},      # Real estate investments
-                "enterprise": {}        # Enterprise investments
+                category: {
+                    code: {**details[category][code], "cashflow": cashflow}
+                    for code, cashflow in cashflows.items()
+                }
+                for category, cashflows in self._passive_cashflows.items()
             }
         }
-        
-        # Initialize expense structure
-        self.expenses = {
+    
+    @property
+    def expenses(self):
+        """Nested expenses view, materialized from the fixed expense slots"""
+        vec = self._expense_vec
+        expenses = {
             "living_expenses": {
                 "children": {
-                    "count": 0,
-                    "cost_per_child": 0,
-                    "total_cost": 0
+                    "count": self._children_count,
+                    "cost_per_child": self._cost_per_child,
+                    "total_cost": vec[0]
                 },
-                "personal": {"total_cost": 0},
-                "spouse": {"total_cost": 0}
-            },
-            "taxes": {"total_cost": 0},
-            "home_mortgage": {"total_cost": 0},
-            "rent": {"total_cost": 0},
-            "car_loan": {"total_cost": 0},
-            "credit_card": {"total_cost": 0},
-            "additional_debt": {"total_cost": 0},
-            "insurance": {"total_cost": 0},
-            "health": {"total_cost": 0},
-            "bank_loan_interest": {"total_cost": 0}
+                "personal": {"total_cost": vec[1]},
+                "spouse": {"total_cost": vec[2]}
+            }
         }
+        slots = self.EXPENSE_SLOTS
+        for expense_type in self._OTHER_EXPENSE_KEYS:
+            expenses[expense_type] = {"total_cost": vec[slots[expense_type]]}
+        return expenses
+    
+    def _recompute_totals(self):
+        """Rebuild the cached totals from scratch (used after bulk loads)"""
+        self._total_active = (sum(self._work_income.values())
+                              + sum(self._side_businesses.values()))
+        for category, cashflows in self._passive_cashflows.items():
+            self._passive_sums[category] = sum(cashflows.values())
+        self._living_total = sum(self._expense_vec[:self._LIVING_SLOTS])
+        self._total_expenses = sum(self._expense_vec)
+    
+    def _put_passive_investment(self, category, code, details, cashflow):
+        """Insert or replace a passive investment and adjust the category sum"""
+        self._dirty = True
+        cashflows = self._passive_cashflows[category]
+        self._passive_sums[category] += cashflow - cashflows.get(code, 0)
+        cashflows[code] = cashflow
+        self._passive_details[category][code] = details
+    
+    def _remove_passive_investment(self, category, code):
+        """Remove a passive investment and adjust the category sum"""
+        cashflow = self._passive_cashflows[category].pop(code, None)
+        if cashflow is not None:
+            self._passive_sums[category] -= cashflow
+            del self._passive_details[category][code]
+            self._dirty = True
     
     def set_work_income(self, personal_salary=0, spouse_salary=0):
         """Set work income for personal and spouse"""
-        self.income["active_income"]["work_income"]["personal_salary"]["cashflow"] = personal_salary
-        self.income["active_income"]["work_income"]["spouse_salary"]["cashflow"] = spouse_salary
+        self._dirty = True
+        work_income = self._work_income
+        self._total_active += (personal_salary - work_income["personal_salary"]
+                               + spouse_salary - work_income["spouse_salary"])
+        work_income["personal_salary"] = personal_salary
+        work_income["spouse_salary"] = spouse_salary
     
     def add_side_business(self, code, cashflow):
         """Add side business income"""
-        self.income["active_income"]["side_business_income"][code] = {"cashflow": cashflow}
+        self._dirty = True
+        side_businesses = self._side_businesses
+        self._total_active += cashflow - side_businesses.get(code, 0)
+        side_businesses[code] = cashflow
     
     def remove_side_business(self, code):
         """Remove side business income"""
-        if code in self.income["active_income"]["side_business_income"]:
-            del self.income["active_income"]["side_business_income"][code]
+        cashflow = self._side_businesses.pop(code, None)
+        if cashflow is not None:
+            self._total_active -= cashflow
+            self._dirty = True
     
     def add_financial_investment(self, code, shares, cashflow):
         """Add financial investment income"""
-        self.income["passive_income"]["financial"][code] = {
-            "shares": shares,
-            "cashflow": cashflow
-        }
+        self._put_passive_investment("financial", code, {"shares": shares}, cashflow)
+    
+    def remove_financial_investment(self, code):
+        """Remove financial investment income"""
+        self._remove_passive_investment("financial", code)
     
     def add_real_estate_investment(self, code, down_payment, cashflow):
         """Add real estate investment income"""
-        self.income["passive_income"]["real_estate"][code] = {
-            "down_payment": down_payment,
-            "cashflow": cashflow
-        }
+        self._put_passive_investment("real_estate", code, {"down_payment": down_payment}, cashflow)
+    
+    def remove_real_estate_investment(self, code):
+        """Remove real estate investment income"""
+        self._remove_passive_investment("real_estate", code)
     
     def add_enterprise_investment(self, code, down_payment, cashflow):
         """Add enterprise investment income"""
-        self.income["passive_income"]["enterprise"][code] = {
-            "down_payment": down_payment,
-            "cashflow": cashflow
-        }
+        self._put_passive_investment("enterprise", code, {"down_payment": down_payment}, cashflow)
+    
+    def remove_enterprise_investment(self, code):
+        """Remove enterprise investment income"""
+        self._remove_passive_investment("enterprise", code)
     
     def set_living_expenses(self, children_count=0, cost_per_child=0, personal_cost=0, spouse_cost=0):
         """Set living expenses"""
-        self.expenses["living_expenses"]["children"]["count"] = children_count
-        self.expenses["living_expenses"]["children"]["cost_per_child"] = cost_per_child
-        self.expenses["living_expenses"]["children"]["total_cost"] = children_count * cost_per_child
-        self.expenses["living_expenses"]["personal"]["total_cost"] = personal_cost
-        self.expenses["living_expenses"]["spouse"]["total_cost"] = spouse_cost
+        self._dirty = True
+        vec = self._expense_vec
+        children_cost = children_count * cost_per_child
+        new_total = children_cost + personal_cost + spouse_cost
+        self._total_expenses += new_total - self._living_total
+        self._living_total = new_total
+        self._children_count = children_count
+        self._cost_per_child = cost_per_child
+        vec[0] = children_cost
+        vec[1] = personal_cost
+        vec[2] = spouse_cost
     
     def set_expense(self, expense_type, amount):
         """Set specific expense amount"""
-        if expense_type in self.expenses:
-            self.expenses[expense_type]["total_cost"] = amount
+        slot = self.EXPENSE_SLOTS.get(expense_type)
+        # Living expense slots are only written through set_living_expenses
+        if slot is not None and slot >= self._LIVING_SLOTS:
+            self._total_expenses += amount - self._expense_vec[slot]
+            self._expense_vec[slot] = amount
+            self._dirty = True
+    
+    def _update_active_income(self, data):
+        """处理update_data中的主动收入数据"""
+        if _WORK_CN in data:
+            work_income = data[_WORK_CN]
+            if _PERSONAL_SALARY_CN in work_income:
+                personal_salary = work_income[_PERSONAL_SALARY_CN].get(_CASHFLOW_CN, 0)
+                self.set_work_income(personal_salary=personal_salary)
     
     def update_data(self, income_data=None, expense_data=None):
         """更新损益表数据 - 为了兼容player.py中的调用"""
         if income_data:
-            # 更新收入数据
-            for category, data in income_data.items():
-                if category == "主动收入":
-                    if "工作收入" in data:
-                        work_income = data["工作收入"]
-                        if "本人工资" in work_income:
-                            personal_salary = work_income["本人工资"].get("现金流", 0)
-                            self.set_work_income(personal_salary=personal_salary)
-                elif category == "被动收入":
-                    # 处理被动收入
-                    pass
+            # 更新收入数据：目前只读取主动收入，其他分类（如被动收入）不在这里处理
+            active = income_data.get(_ACTIVE_CN)
+            if active is not None:
+                self._update_active_income(active)
         
         if expense_data:
             # 更新支出数据
             for expense_type, amount in expense_data.items():
-                if isinstance(amount, dict) and "total_cost" in amount:
-                    self.set_expense(expense_type, amount["total_cost"])
+                if isinstance(amount, dict):
+                    if "total_cost" in amount:
+                        self.set_expense(expense_type, amount["total_cost"])
                 elif isinstance(amount, (int, float)):
                     self.set_expense(expense_type, amount)
     
     def get_data(self):
-        """获取完整的损益表数据"""
-        return {
+        """获取完整的损益表数据（数据未变动时直接返回上次的结果）"""
+        if not self._dirty:
+            return self._cached_data
+        self._cached_data = {
             "收入": self.income,
             "支出": self.expenses,
             "总收入": self.get_total_income(),
             "总支出": self.get_total_expenses(),
             "月现金流": self.get_monthly_cashflow()
         }
+        self._dirty = False
+        return self._cached_data
     
     def print_summary(self):
         """打印损益表摘要"""
@@ -136,35 +238,12 @@ class IncomeStatement:
 
     def get_total_active_income(self):
         """Calculate total active income"""
-        total = 0
-        # Work income
-        work_income = self.income["active_income"]["work_income"]
-        total += work_income["personal_salary"]["cashflow"]
-        total += work_income["spouse_salary"]["cashflow"]
-        
-        # Side business income  
-        for business in self.income["active_income"]["side_business_income"].values():
-            total += business["cashflow"]
-        
-        return total
+        return self._total_active
     
     def get_total_passive_income(self):
         """Calculate total passive income"""
-        total = 0
-        
-        # Financial investments
-        for investment in self.income["passive_income"]["financial"].values():
-            total += investment["cashflow"]
-        
-        # Real estate investments
-        for investment in self.income["passive_income"]["real_estate"].values():
-            total += investment["cashflow"]
-        
-        # Enterprise investments
-        for investment in self.income["passive_income"]["enterprise"].values():
-            total += investment["cashflow"]
-        
-        return total
+        sums = self._passive_sums
+        return sums["financial"] + sums["real_estate"] + sums["enterprise"]
     
     def get_total_income(self):
         """Calculate total income"""
@@ -172,21 +251,7 @@ class IncomeStatement:
     
     def get_total_expenses(self):
         """Calculate total expenses"""
-        total = 0
-        
-        # Living expenses
-        living = self.expenses["living_expenses"]
-        total += living["children"]["total_cost"]
-        total += living["personal"]["total_cost"]
-        total += living["spouse"]["total_cost"]
-        
-        # Other expenses
-        for expense_type in ["taxes", "home_mortgage", "rent", "car_loan", 
-                           "credit_card", "additional_debt", "insurance", 
-                           "health", "bank_loan_interest"]:
-            total += self.expenses[expense_type]["total_cost"]
-        
-        return total
+        return self._total_expenses
     
     def get_monthly_cashflow(self):
         """Calculate monthly cash flow (income - expenses)"""
@@ -194,56 +259,59 @@ class IncomeStatement:
     
     def print_statement(self):
         """Print formatted income statement"""
-        print("=== 损益表 (Income Statement) ===")
-        print("\n收入 (Income):")
+        lines = []
+        lines.append("=== 损益表 (Income Statement) ===")
+        lines.append("\n收入 (Income):")
         
         # Active income
-        print("  主动收入 (Active Income):")
-        work_income = self.income["active_income"]["work_income"]
-        print(f"    本人工资: {work_income['personal_salary']['cashflow']:,}元")
-        print(f"    配偶工资: {work_income['spouse_salary']['cashflow']:,}元")
+        lines.append("  主动收入 (Active Income):")
+        work_income = self._work_income
+        lines.append(f"    本人工资: {work_income['personal_salary']:,}元")
+        lines.append(f"    配偶工资: {work_income['spouse_salary']:,}元")
         
-        if self.income["active_income"]["side_business_income"]:
-            print("    副业收入:")
-            for code, data in self.income["active_income"]["side_business_income"].items():
-                print(f"      {code}: {data['cashflow']:,}元")
+        if self._side_businesses:
+            lines.append("    副业收入:")
+            for code, cashflow in self._side_businesses.items():
+                lines.append(f"      {code}: {cashflow:,}元")
         
         # Passive income
-        print("  被动收入 (Passive Income):")
-        if self.income["passive_income"]["financial"]:
-            print("    金融投资:")
-            for code, data in self.income["passive_income"]["financial"].items():
-                print(f"      {code} ({data['shares']}份): {data['cashflow']:,}元")
+        lines.append("  被动收入 (Passive Income):")
+        passive = self._passive_cashflows
+        if passive["financial"]:
+            lines.append("    金融投资:")
+            shares = self._passive_details["financial"]
+            for code, cashflow in passive["financial"].items():
+                lines.append(f"      {code} ({shares[code]['shares']}份): {cashflow:,}元")
         
-        if self.income["passive_income"]["real_estate"]:
-            print("    房地产投资:")
-            for code, data in self.income["passive_income"]["real_estate"].items():
-                print(f"      {code}: {data['cashflow']:,}元")
+        if passive["real_estate"]:
+            lines.append("    房地产投资:")
+            for code, cashflow in passive["real_estate"].items():
+                lines.append(f"      {code}: {cashflow:,}元")
         
-        if self.income["passive_income"]["enterprise"]:
-            print("    企业投资:")
-            for code, data in self.income["passive_income"]["enterprise"].items():
-                print(f"      {code}: {data['cashflow']:,}元")
+        if passive["enterprise"]:
+            lines.append("    企业投资:")
+            for code, cashflow in passive["enterprise"].items():
+                lines.append(f"      {code}: {cashflow:,}元")
         
-        print(f"\n总收入: {self.get_total_income():,}元")
+        lines.append(f"\n总收入: {self.get_total_income():,}元")
         
         # Expenses
-        print("\n支出 (Expenses):")
-        living = self.expenses["living_expenses"]
-        print(f"  生活支出: {living['children']['total_cost'] + living['personal']['total_cost'] + living['spouse']['total_cost']:,}元")
-        print(f"    孩子 ({living['children']['count']}个): {living['children']['total_cost']:,}元")
-        print(f"    本人: {living['personal']['total_cost']:,}元")
-        print(f"    配偶: {living['spouse']['total_cost']:,}元")
+        lines.append("\n支出 (Expenses):")
+        vec = self._expense_vec
+        lines.append(f"  生活支出: {self._living_total:,}元")
+        lines.append(f"    孩子 ({self._children_count}个): {vec[0]:,}元")
+        lines.append(f"    本人: {vec[1]:,}元")
+        lines.append(f"    配偶: {vec[2]:,}元")
         
-        for expense_type in ["taxes", "home_mortgage", "rent", "car_loan", 
-                           "credit_card", "additional_debt", "insurance", 
-                           "health", "bank_loan_interest"]:
-            amount = self.expenses[expense_type]["total_cost"]
+        slots = self.EXPENSE_SLOTS
+        for expense_type in self._OTHER_EXPENSE_KEYS:
+            amount = vec[slots[expense_type]]
             if amount > 0:
-                print(f"  {expense_type}: {amount:,}元")
+                lines.append(f"  {expense_type}: {amount:,}元")
         
-        print(f"\n总支出: {self.get_total_expenses():,}元")
-        print(f"月现金流: {self.get_monthly_cashflow():,}元")
+        lines.append(f"\n总支出: {self.get_total_expenses():,}元")
+        lines.append(f"月现金流: {self.get_monthly_cashflow():,}元")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def to_dict(self):
         """Convert to dictionary for serialization"""
@@ -253,11 +321,41 @@ class IncomeStatement:
         }
     
     def from_dict(self, data):
-        """Load from dictionary"""
+        """Load from dictionary - values are copied into the flat stores, data is not retained"""
         if "income" in data:
-            self.income = data["income"]
+            income = data["income"]
+            active = income.get("active_income", {})
+            work_income = active.get("work_income", {})
+            for key in self._work_income:
+                self._work_income[key] = work_income.get(key, {}).get("cashflow", 0)
+            self._side_businesses = {
+                code: entry["cashflow"]
+                for code, entry in active.get("side_business_income", {}).items()
+            }
+            passive = income.get("passive_income", {})
+            for category in self._passive_cashflows:
+                investments = passive.get(category, {})
+                self._passive_cashflows[category] = {
+                    code: entry["cashflow"] for code, entry in investments.items()
+                }
+                self._passive_details[category] = {
+                    code: {key: value for key, value in entry.items() if key != "cashflow"}
+                    for code, entry in investments.items()
+                }
         if "expenses" in data:
-            self.expenses = data["expenses"]
+            expenses = data["expenses"]
+            children = expenses.get("living_expenses", {}).get("children", {})
+            self._children_count = children.get("count", 0)
+            self._cost_per_child = children.get("cost_per_child", 0)
+            vec = self._expense_vec
+            for expense_type, slot in self.EXPENSE_SLOTS.items():
+                if slot < self._LIVING_SLOTS:
+                    entry = expenses.get("living_expenses", {}).get(expense_type, {})
+                else:
+                    entry = expenses.get(expense_type, {})
+                vec[slot] = entry.get("total_cost", 0)
+        self._recompute_totals()
+        self._dirty = True
 
 if __name__ == "__main__":
     # Test the income statement
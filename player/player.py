@@ -84,6 +84,8 @@ Player类用于模拟"穷爸爸富爸爸"财富流游戏中的玩家
 更新日期：2024年
 """
 
+from array import array
+
 # 导入标准化的财务报表系统
 from .income_statement import IncomeStatement
 from .balance_sheet import BalanceSheet
@@ -93,6 +95,19 @@ class Player:
     玩家类，适用于穷爸爸富爸爸的财富流游戏。
     """
 
+    # position/active_layer/children/downsized_turns由游戏引擎和格子事件按需设置，
+    # 未设置时读取会抛AttributeError，与hasattr/getattr默认值的用法保持一致
+    __slots__ = ("name", "profession", "salary", "cash", "assets", "liabilities",
+                 "_passive_income", "_expenses", "_free", "_income_tags", "_income_amounts",
+                 "income_statement", "balance_sheet",
+                 "position", "active_layer", "children", "downsized_turns")
+
+    # 收支记录类型，_income_tags中保存的是下标
+    SALARY, PASSIVE, EXPENSES = 0, 1, 2
+    _INCOME_TAG_NAMES = ("salary", "passive_income", "expenses")
+
+    _FMT = "玩家: %s, 职业: %s, 现金: %s, 工资: %s, 被动收入: %s, 支出: %s, 资产数: %d, 负债数: %d"
+
     def __init__(self, name, profession, salary, cash=0, assets=None, liabilities=None, passive_income=0, expenses=0):
         """
         初始化玩家属性
@@ -109,11 +124,15 @@ class Player:
         self.profession = profession
         self.salary = salary
         self.cash = cash
-        self.assets = assets if assets is not None else []
-        self.liabilities = liabilities if liabilities is not None else []
-        self.passive_income = passive_income
-        self.expenses = expenses
-        self.income_history = []
+        self.assets = [] if assets is None else assets
+        self.liabilities = [] if liabilities is None else liabilities
+        # 被动收入和支出通过属性写入，写入时同步更新财务自由标志_free
+        self._passive_income = passive_income
+        self._expenses = expenses
+        self._free = passive_income >= expenses
+        # 收支记录按列存储：类型下标和金额两个并行序列（金额可能是浮点数，用list保存）
+        self._income_tags = array("B")
+        self._income_amounts = []
         
         # 整合同事的财务报表系统
         self.income_statement = IncomeStatement()
@@ -122,6 +141,32 @@ class Player:
         # 初始化财务数据
         self._sync_financial_data()
 
+    @property
+    def passive_income(self):
+        """被动收入"""
+        return self._passive_income
+
+    @passive_income.setter
+    def passive_income(self, value):
+        self._passive_income = value
+        self._free = value >= self._expenses
+
+    @property
+    def expenses(self):
+        """月支出"""
+        return self._expenses
+
+    @expenses.setter
+    def expenses(self, value):
+        self._expenses = value
+        self._free = self._passive_income >= value
+
+    @property
+    def income_history(self):
+        """收支记录，按(类型, 金额)元组列表返回"""
+        names = self._INCOME_TAG_NAMES
+        return [(names[tag], amount) for tag, amount in zip(self._income_tags, self._income_amounts)]
+
     def _sync_financial_data(self):
         """同步财务数据到报表系统"""
         # 更新损益表
@@ -176,11 +221,10 @@ class Player:
     def add_asset(self, asset):
         """
         增加资产
-        :param asset: 资产对象或描述
+        :param asset: 资产对象（需提供passive_income属性，如Asset）
         """
         self.assets.append(asset)
-        if hasattr(asset, 'passive_income'):
-            self.passive_income += asset.passive_income
+        self.passive_income += asset.passive_income
         
         # 同步到财务报表系统
         self._sync_financial_data()
@@ -188,11 +232,10 @@ class Player:
     def add_liability(self, liability):
         """
         增加负债
-        :param liability: 负债对象或描述
+        :param liability: 负债对象（需提供expense属性，如Liability）
         """
         self.liabilities.append(liability)
-        if hasattr(liability, 'expense'):
-            self.expenses += liability.expense
+        self.expenses += liability.expense
         
         # 同步到财务报表系统  
         self._sync_financial_data()
@@ -202,7 +245,8 @@ class Player:
         收取工资
         """
         self.cash += self.salary
-        self.income_history.append(('salary', self.salary))
+        self._income_tags.append(self.SALARY)
+        self._income_amounts.append(self.salary)
         
         # 更新资产负债表中的银行存款
         self.balance_sheet.update_data(
@@ -214,7 +258,8 @@ class Player:
         收取被动收入
         """
         self.cash += self.passive_income
-        self.income_history.append(('passive_income', self.passive_income))
+        self._income_tags.append(self.PASSIVE)
+        self._income_amounts.append(self.passive_income)
         
         # 更新资产负债表中的银行存款
         self.balance_sheet.update_data(
@@ -226,13 +271,33 @@ class Player:
         支付支出
         """
         self.cash -= self.expenses
-        self.income_history.append(('expenses', -self.expenses))
+        self._income_tags.append(self.EXPENSES)
+        self._income_amounts.append(-self.expenses)
         
         # 更新资产负债表中的银行存款
         self.balance_sheet.update_data(
             asset_data={"银行存款": {"金额": self.cash}}
         )
 
+    def end_of_turn(self):
+        """
+        发薪日结算：一次完成收取工资、收取被动收入和支付支出
+        :return: 本次净收入
+        """
+        salary = self.salary
+        passive_income = self._passive_income
+        expenses = self._expenses
+        net_income = salary + passive_income - expenses
+        self.cash += net_income
+        self._income_tags.extend((self.SALARY, self.PASSIVE, self.EXPENSES))
+        self._income_amounts.extend((salary, passive_income, -expenses))
+        
+        # 更新资产负债表中的银行存款
+        self.balance_sheet.update_data(
+            asset_data={"银行存款": {"金额": self.cash}}
+        )
+        return net_income
+
     def buy_asset(self, asset, price):
         """
         购买资产
@@ -258,7 +323,7 @@ class Player:
         """
         判断是否财务自由（被动收入 >= 支出）
         """
-        return self.passive_income >= self.expenses
+        return self._free
 
     def transfer_asset_to(self, other_player, asset, price):
         """
@@ -270,8 +335,7 @@ class Player:
         """
         if asset in self.assets and other_player.cash >= price:
             self.assets.remove(asset)
-            if hasattr(asset, 'passive_income'):
-                self.passive_income -= asset.passive_income
+            self.passive_income -= asset.passive_income
             other_player.cash -= price
             self.cash += price
             other_player.add_asset(asset)
@@ -279,12 +343,15 @@ class Player:
         return False
 
     def __str__(self):
-        return (f"玩家: {self.name}, 职业: {self.profession}, 现金: {self.cash}, "
-                f"工资: {self.salary}, 被动收入: {self.passive_income}, 支出: {self.expenses}, "
-                f"资产数: {len(self.assets)}, 负债数: {len(self.liabilities)}")
+        return self._FMT % (self.name, self.profession, self.cash,
+                            self.salary, self._passive_income, self._expenses,
+                            len(self.assets), len(self.liabilities))
 
 class Asset:
     """资产类"""
+    __slots__ = ("name", "type", "cost", "passive_income")
+    _FMT = "资产: %s (%s), 成本: %s, 被动收入: %s"
+
     def __init__(self, name, asset_type, cost=0, passive_income=0):
         self.name = name
         self.type = asset_type  # 'real_estate', 'business', 'stocks', 'enterprise', etc.
@@ -292,19 +359,25 @@ class Asset:
         self.passive_income = passive_income
     
     def __str__(self):
-        return f"资产: {self.name} ({self.type}), 成本: {self.cost}, 被动收入: {self.passive_income}"
+        return self._FMT % (self.name, self.type, self.cost, self.passive_income)
 
 class Liability:
     """负债类"""
+    __slots__ = ("name", "expense")
+    _FMT = "负债: %s, 月支出: %s"
+
     def __init__(self, name, expense):
         self.name = name
         self.expense = expense  # 月支出
     
     def __str__(self):
-        return f"负债: {self.name}, 月支出: {self.expense}"
+        return self._FMT % (self.name, self.expense)
 
 class FinancialAsset(Asset):
     """金融资产类 - 用于股票、基金等"""
+    __slots__ = ("shares", "price_per_share", "dividend_per_share")
+    _FMT = "金融资产: %s, 股数: %s, 每股价格: %s, 总股息: %s"
+
     def __init__(self, name, shares, price_per_share, dividend_per_share):
         total_cost = shares * price_per_share
         total_dividend = shares * dividend_per_share
@@ -314,8 +387,7 @@ class FinancialAsset(Asset):
         self.dividend_per_share = dividend_per_share
     
     def __str__(self):
-        return (f"金融资产: {self.name}, 股数: {self.shares}, "
-                f"每股价格: {self.price_per_share}, 总股息: {self.passive_income}")
+        return self._FMT % (self.name, self.shares, self.price_per_share, self.passive_income)
 
 # 测试代码
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+"""
+职业数据加载
+启动器(main.py)和游戏主窗口共用的职业列表读取与默认值
+"""
+
+import os
+import json
+from functools import lru_cache
+
+PROFESSIONS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "data", "professions.json")
+
+# 职业文件缺失或损坏时使用的默认职业
+DEFAULT_PROFESSIONS = [
+    {"id": "engineer", "name": "工程师", "salary": 5000, "initial_cash": 10000, "initial_expenses": 2500},
+    {"id": "teacher", "name": "教师", "salary": 4000, "initial_cash": 8000, "initial_expenses": 2000},
+    {"id": "doctor", "name": "医生", "salary": 8000, "initial_cash": 15000, "initial_expenses": 4000},
+    {"id": "lawyer", "name": "律师", "salary": 7000, "initial_cash": 12000, "initial_expenses": 3500},
+    {"id": "manager", "name": "经理", "salary": 6000, "initial_cash": 11000, "initial_expenses": 3000},
+    {"id": "nurse", "name": "护士", "salary": 3500, "initial_cash": 7000, "initial_expenses": 1800}
+]
+
+@lru_cache(maxsize=4)
+def _read_professions(path, mtime):
+    """读取职业文件；以(路径, 修改时间)为键缓存，文件未改动时不再读盘（出错时抛出异常，不会被缓存）"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['professions']
+
+def load_professions():
+    """加载职业数据，文件修改后会重新读取；文件缺失或格式错误时返回默认职业"""
+    try:
+        mtime = os.path.getmtime(PROFESSIONS_PATH)
+        return _read_professions(PROFESSIONS_PATH, mtime)
+    except FileNotFoundError:
+        print(f"警告: 找不到文件 {PROFESSIONS_PATH}，使用默认职业")
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"加载职业数据时出错: {e}，使用默认职业")
+    return DEFAULT_PROFESSIONS
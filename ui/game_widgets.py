@@ -79,46 +79,74 @@
 
 import tkinter as tk
 from tkinter import ttk
+from collections import deque
+
+from cards.base import card_display_lines
 
 class PlayerInfoWidget:
     """玩家信息显示组件"""
+    __slots__ = ("player", "frame", "cash_var", "cash_label", "income_var", "income_label",
+                 "expense_var", "expense_label", "freedom_var", "freedom_label", "_last")
+    
+    # 标签文本模板
+    _CASH_FMT = "现金: {}"
+    _INCOME_FMT = "被动收入: {}"
+    _EXPENSE_FMT = "支出: {}"
     
     def __init__(self, parent, player):
         self.player = player
         self.frame = ttk.LabelFrame(parent, text=player.name, padding="5")
         
+        # 各标签绑定StringVar，更新时只写Tcl变量而不必重新设置控件选项
         # 现金
-        self.cash_label = ttk.Label(self.frame, text=f"现金: {player.cash}")
+        self.cash_var = tk.StringVar(value=self._CASH_FMT.format(player.cash))
+        self.cash_label = ttk.Label(self.frame, textvariable=self.cash_var)
         self.cash_label.pack(anchor="w")
         
         # 被动收入
-        self.income_label = ttk.Label(self.frame, text=f"被动收入: {player.passive_income}")
+        self.income_var = tk.StringVar(value=self._INCOME_FMT.format(player.passive_income))
+        self.income_label = ttk.Label(self.frame, textvariable=self.income_var)
         self.income_label.pack(anchor="w")
         
         # 支出
-        self.expense_label = ttk.Label(self.frame, text=f"支出: {player.expenses}")
+        self.expense_var = tk.StringVar(value=self._EXPENSE_FMT.format(player.expenses))
+        self.expense_label = ttk.Label(self.frame, textvariable=self.expense_var)
         self.expense_label.pack(anchor="w")
         
         # 财务自由状态
-        self.freedom_label = ttk.Label(self.frame, 
-            text="财务自由" if player.is_financially_free() else "未财务自由",
-            foreground="green" if player.is_financially_free() else "red")
+        is_free = player.is_financially_free()
+        self.freedom_var = tk.StringVar(value="财务自由" if is_free else "未财务自由")
+        self.freedom_label = ttk.Label(self.frame, textvariable=self.freedom_var,
+            foreground="green" if is_free else "red")
         self.freedom_label.pack(anchor="w")
+        
+        # 上次显示的(现金, 被动收入, 支出, 财务自由)，用于跳过没有变化的标签
+        self._last = (player.cash, player.passive_income, player.expenses, is_free)
     
     def update(self):
-        """更新显示"""
-        self.cash_label.config(text=f"现金: {self.player.cash}")
-        self.income_label.config(text=f"被动收入: {self.player.passive_income}")
-        self.expense_label.config(text=f"支出: {self.player.expenses}")
+        """更新显示（只刷新数值发生变化的标签）"""
+        player = self.player
+        state = (player.cash, player.passive_income, player.expenses,
+                 player.is_financially_free())
+        last = self._last
+        if state == last:
+            return
+        cash, passive_income, expenses, is_free = state
         
-        is_free = self.player.is_financially_free()
-        self.freedom_label.config(
-            text="财务自由" if is_free else "未财务自由",
-            foreground="green" if is_free else "red"
-        )
+        if cash != last[0]:
+            self.cash_var.set(self._CASH_FMT.format(cash))
+        if passive_income != last[1]:
+            self.income_var.set(self._INCOME_FMT.format(passive_income))
+        if expenses != last[2]:
+            self.expense_var.set(self._EXPENSE_FMT.format(expenses))
+        if is_free != last[3]:
+            self.freedom_var.set("财务自由" if is_free else "未财务自由")
+            self.freedom_label.config(foreground="green" if is_free else "red")
+        self._last = state
 
 class CardInfoWidget:
     """卡片信息显示组件"""
+    __slots__ = ("frame", "card_name", "card_desc", "card_details", "_current_card")
     
     def __init__(self, parent):
         self.frame = ttk.LabelFrame(parent, text="当前卡片", padding="10")
@@ -131,35 +159,45 @@ class CardInfoWidget:
         
         self.card_details = ttk.Label(self.frame, text="")
         self.card_details.pack(anchor="w")
+        
+        # 当前显示的卡片（用唯一对象占位，保证第一次set_card(None)也会刷新）
+        self._current_card = self
     
     def set_card(self, card):
-        """设置显示的卡片"""
+        """设置显示的卡片，同一张卡片重复设置时不做任何操作"""
+        if card is self._current_card:
+            return
+        self._current_card = card
+        
         if card:
             self.card_name.config(text=card.name)
             self.card_desc.config(text=card.description)
-            
-            details = []
-            if hasattr(card, 'cost'):
-                details.append(f"成本: {card.cost}")
-            if hasattr(card, 'down_payment'):
-                details.append(f"首付: {card.down_payment}")
-            if hasattr(card, 'monthly_cash_flow'):
-                details.append(f"月现金流: {card.monthly_cash_flow}")
-            
-            self.card_details.config(text="\n".join(details))
+            self.card_details.config(text="\n".join(card_display_lines(card)))
         else:
             self.card_name.config(text="无卡片")
             self.card_desc.config(text="")
             self.card_details.config(text="")
 
 class GameLogWidget:
-    """游戏日志组件"""
+    """游戏日志组件：消息先进入定长缓冲区，合并后追加到文本框，文本框最多保留max_lines行"""
+    __slots__ = ("frame", "max_lines", "_pending", "_line_count", "_flush_scheduled", "text")
     
-    def __init__(self, parent):
+    FLUSH_DELAY_MS = 80  # 合并刷新的间隔
+    
+    def __init__(self, parent, max_lines=500):
         self.frame = ttk.LabelFrame(parent, text="游戏日志", padding="5")
+        self.max_lines = max_lines
+        
+        # 待写入的消息；超过max_lines的部分写入后也会被裁掉，所以直接在缓冲区丢弃
+        self._pending = deque(maxlen=max_lines)
+        self._line_count = 0  # 文本框中当前的行数
+        self._flush_scheduled = False
         
         # 文本框和滚动条
         self.text = tk.Text(self.frame, height=8, wrap=tk.WORD, state="disabled")
+        # 始终停在文本末尾的标记（右重力：在它的位置插入文本时标记跟随到后面）
+        self.text.mark_set("tail", "end-1c")
+        self.text.mark_gravity("tail", tk.RIGHT)
         scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.text.yview)
         
         self.text.configure(yscrollcommand=scrollbar.set)
@@ -168,20 +206,47 @@ class GameLogWidget:
         scrollbar.pack(side="right", fill="y")
     
     def add_message(self, message):
-        """添加日志消息"""
+        """添加日志消息（先写入缓冲区，稍后统一追加显示）"""
+        self._pending.append(message + "\n")
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.text.after(self.FLUSH_DELAY_MS, self._flush)
+    
+    def _flush(self):
+        """把缓冲区中的消息一次性追加到文本框，超过max_lines时从顶部裁掉最旧的行"""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        joined = "".join(self._pending)
+        self._pending.clear()
+        
+        at_bottom = self.text.yview()[1] >= 0.999
         self.text.config(state="normal")
-        self.text.insert(tk.END, message + "\n")
+        self.text.insert(tk.END, joined)
+        self._line_count += joined.count("\n")
+        
+        overflow = self._line_count - self.max_lines
+        if overflow > 0:
+            # 删除可见区域上方的行时Tk会保持当前可见内容不变，无需恢复视图位置
+            self.text.delete("1.0", f"{overflow + 1}.0")
+            self._line_count = self.max_lines
         self.text.config(state="disabled")
-        self.text.see(tk.END)
+        
+        # 只有原本就停在底部时才自动滚动
+        if at_bottom:
+            self.text.see("tail")
     
     def clear(self):
         """清空日志"""
+        self._pending.clear()
+        self._line_count = 0
         self.text.config(state="normal")
         self.text.delete(1.0, tk.END)
         self.text.config(state="disabled")
 
 class DiceWidget:
     """骰子显示组件"""
+    __slots__ = ("frame", "dice_label", "value_label")
     
     def __init__(self, parent):
         self.frame = ttk.Frame(parent)
@@ -84,15 +84,107 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-import json
+from tkinter import font as tkfont
 import os
+from math import cos, sin, pi
+from collections import deque
+from functools import lru_cache
+from itertools import cycle, islice
 
 from game import GameEngine
 from player import Player
+from player.professions import load_professions
+from cards.base import card_display_lines
+
+# 各回合阶段下按钮的状态：(投骰子, 移动, 结束回合, 购买, 放弃)
+# 不在表中的阶段（格子事件、层级转换）所有按钮都禁用
+_ALL_BUTTONS_DISABLED = ("disabled",) * 5
+PHASE_BUTTON_STATES = {
+    "投骰子": ("normal", "disabled", "disabled", "disabled", "disabled"),
+    "移动": ("disabled", "normal", "disabled", "disabled", "disabled"),
+    "结束回合": ("disabled", "disabled", "normal", "disabled", "disabled"),
+    "卡片决策": ("disabled", "disabled", "disabled", "normal", "normal"),
+    # 市场操作：允许直接结束回合
+    "市场操作": ("disabled", "disabled", "normal", "disabled", "disabled"),
+}
+
+TAU = 2 * pi  # 圆形布局一整圈的弧度
+
+@lru_cache(maxsize=None)
+def _unit_circle(size):
+    """单位圆上均分size个点的(cos, sin)表，每种格子数量只计算一次"""
+    step = TAU / size
+    return tuple((cos(step * i), sin(step * i)) for i in range(size))
+
+@lru_cache(maxsize=None)
+def _cell_labels(size):
+    """格子编号文本"0".."size-1"，每种格子数量只生成一次"""
+    return tuple(map(str, range(size)))
+
+# 玩家列表和层级标签中圈层的显示名称
+LAYER_SHORT_NAMES = {"inner": "内圈", "middle": "中圈", "outer": "外圈"}
+LAYER_FULL_NAMES = {"inner": "逆流层(内圈)", "middle": "平流层(中圈)", "outer": "顺流层(外圈)"}
+
+# 帮助菜单中"游戏规则"和"关于"对话框的文本
+RULES_TEXT = """
+财富流游戏规则:
+
+1. 游戏目标：通过投资和理财达到财务自由（被动收入 >= 支出）
+
+2. 游戏流程：
+   - 投骰子移动
+   - 执行格子事件
+   - 根据情况购买投资机会
+   - 管理资产和负债
+
+3. 格子类型：
+   - 发薪水：收取工资和被动收入，支付支出
+   - 机会：抽取投资机会卡片
+   - 意外支出：遇到突发费用
+   - 市场：可以买卖资产
+   - 慈善：根据孩子数量获得奖励
+   - 裁员：暂时失去工资收入
+   - 生孩子：增加支出但有慈善收益
+
+4. 卡片类型：
+   - 企业卡：高投入高回报的企业投资
+   - 机会卡：各种房地产和商业投资
+   - 金融卡：股票、基金等金融产品
+   - 副业卡：小投入快回报的副业
+        """
+
+ABOUT_TEXT = """
+财富流游戏 v1.0
+
+基于《富爸爸穷爸爸》理念的财务教育游戏
+帮助玩家学习投资和理财知识
+
+开发者：AI助手
+框架：Python + Tkinter
+        """
+
+# 棋盘各圈层格子的边框颜色，按绘制顺序(外圈 → 中圈 → 内圈)
+LAYER_OUTLINE_COLORS = (("outer", "lightblue"), ("middle", "red"), ("inner", "green"))
+# 玩家标记颜色，按玩家序号循环使用
+PLAYER_COLORS = ("red", "green", "blue", "yellow", "purple", "orange")
 
 class MainWindow:
     """主游戏窗口"""
     
+    LOG_MAX_LINES = 500  # 游戏日志保留的最大行数
+    LOG_FLUSH_DELAY_MS = 80  # 日志合并写入的间隔
+    
+    # 内层Z字形各格子相对中心点的偏移（以内圈半径为单位）
+    # 第一行: 1 2 3 4
+    # 中间: 5 (星号位置)
+    # 第二行: 6 7 8 9
+    _Z_OFFSETS = (
+        (0, 0),                                          # 0: 不使用，从1开始编号
+        (-0.6, -0.4), (-0.2, -0.4), (0.2, -0.4), (0.6, -0.4),  # 1-4: 第一行(从左到右)
+        (0, 0),                                          # 5: 中心点(星号* - 转换点)
+        (-0.6, 0.4), (-0.2, 0.4), (0.2, 0.4), (0.6, 0.4),      # 6-9: 第二行(从左到右)
+    )
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("财富流游戏 - Cash Flow Game")
@@ -102,12 +194,48 @@ class MainWindow:
         # 游戏引擎
         self.game_engine = None
         
+        # 棋盘绘制状态：静态部分是否已绘制、几何参数、各层格子坐标表、玩家标记的canvas id
+        self._static_drawn = False
+        self._board_geometry = None
+        self._canvas_size = None  # 最近一次<Configure>事件给出的画布尺寸
+        self._cell_xy = {}
+        self._player_tokens = {}
+        # 各圈层格子的填充颜色，棋盘在一局游戏中不变，每局只查询一次
+        self._square_fills = {}
+        
+        # 上次显示的卡片及其信息文本；初始为哨兵，保证第一次一定刷新
+        self._last_card = self
+        self._last_card_info = None
+        
+        # 玩家列表中每个玩家对应的行id，以及每行上次显示的内容
+        self._player_row_ids = []
+        self._player_row_cache = []
+        self._player_rows_engine = None  # 当前这些行所属的游戏引擎
+        self._last_layer_text = None  # 层级标签上次显示的文本
+        
+        # 是否已有待执行的界面刷新，以及这次刷新是否需要同时重绘棋盘
+        self._ui_update_pending = False
+        self._board_redraw_pending = False
+        
+        # 玩家设置对话框，首次打开时创建，之后重复使用
+        self._setup_dialog = None
+        
+        # 上次应用按钮状态时的回合阶段和各按钮状态（按钮创建时均为禁用）
+        self._last_phase = None
+        self._button_states = _ALL_BUTTONS_DISABLED
+        # 状态标签上次显示的文本
+        self._last_status_text = None
+        
         # UI组件
         self.setup_ui()
         self.load_professions()
         
     def setup_ui(self):
         """设置UI界面"""
+        # 棋盘文字使用的命名字体只创建一次，create_text直接引用，避免每个图元重新解析字体描述
+        self._font_bold = tkfont.Font(family="Arial", size=10, weight="bold")  # 圈层标签、内圈编号
+        self._font_star = tkfont.Font(family="Arial", size=12, weight="bold")  # 内圈星号
+        
         # 主菜单栏
         self.create_menu()
         
@@ -201,13 +329,15 @@ class MainWindow:
         # 分隔符
         ttk.Separator(control_frame, orient="horizontal").pack(fill=tk.X, pady=10)
         
-        # 当前状态显示
-        self.status_label = ttk.Label(control_frame, text="请开始新游戏", 
+        # 当前状态显示（状态、骰子、卡片、层级标签都绑定StringVar，更新时只写变量）
+        self.status_var = tk.StringVar(value="请开始新游戏")
+        self.status_label = ttk.Label(control_frame, textvariable=self.status_var, 
                                     foreground="blue", font=("Arial", 10, "bold"))
         self.status_label.pack(pady=5)
         
         # 骰子结果显示
-        self.dice_label = ttk.Label(control_frame, text="", 
+        self.dice_var = tk.StringVar(value="")
+        self.dice_label = ttk.Label(control_frame, textvariable=self.dice_var, 
                                   font=("Arial", 16, "bold"))
         self.dice_label.pack(pady=5)
         
@@ -215,7 +345,8 @@ class MainWindow:
         self.card_frame = ttk.LabelFrame(control_frame, text="当前卡片")
         self.card_frame.pack(fill=tk.X, pady=10)
         
-        self.card_info_label = ttk.Label(self.card_frame, text="无", wraplength=200)
+        self.card_info_var = tk.StringVar(value="无")
+        self.card_info_label = ttk.Label(self.card_frame, textvariable=self.card_info_var, wraplength=200)
         self.card_info_label.pack(pady=5)
         
         self.buy_card_btn = ttk.Button(self.card_frame, text="购买", 
@@ -230,7 +361,8 @@ class MainWindow:
         self.layer_frame = ttk.LabelFrame(control_frame, text="层级信息")
         self.layer_frame.pack(fill=tk.X, pady=10)
         
-        self.layer_info_label = ttk.Label(self.layer_frame, text="当前层级: 平流层(中圈)", wraplength=200)
+        self.layer_info_var = tk.StringVar(value="当前层级: 平流层(中圈)")
+        self.layer_info_label = ttk.Label(self.layer_frame, textvariable=self.layer_info_var, wraplength=200)
         self.layer_info_label.pack(pady=5)
         
     def create_game_board(self, parent):
@@ -242,8 +374,16 @@ class MainWindow:
         self.board_canvas = tk.Canvas(board_frame, width=600, height=500, bg="white")
         self.board_canvas.pack(fill=tk.BOTH, expand=True)
         
-        # 延迟绘制棋盘，确保canvas完全初始化
-        self.board_canvas.after(100, self.draw_board)
+        # 画布第一次显示以及之后尺寸变化时都会收到<Configure>事件，在其中（重新）绘制棋盘
+        self.board_canvas.bind("<Configure>", self._on_board_resize)
+    
+    def _on_board_resize(self, event):
+        """记录画布尺寸；尺寸变化时让静态棋盘失效并重绘"""
+        canvas_size = (max(event.width, 600), max(event.height, 500))
+        self._canvas_size = canvas_size
+        if self._board_geometry is None or canvas_size != self._board_geometry["canvas_size"]:
+            self._static_drawn = False
+            self.draw_board()
         
     def create_player_panel(self, parent):
         """创建玩家信息面板"""
@@ -292,6 +432,13 @@ class MainWindow:
         # 日志文本框
         self.log_text = tk.Text(log_frame, height=8, wrap=tk.WORD)
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # 始终停在日志末尾的标记，自动滚动时直接定位到它
+        self.log_text.mark_set("tail", "end-1c")
+        self.log_text.mark_gravity("tail", tk.RIGHT)
+        self._log_line_count = 0
+        # 待写入的消息；每条至少一行，超过LOG_MAX_LINES的部分写入后也会被裁掉，所以直接在缓冲区丢弃
+        self._log_pending = deque(maxlen=self.LOG_MAX_LINES)
+        self._log_flush_scheduled = False
         
         # 滚动条
         log_scrollbar = ttk.Scrollbar(log_frame, orient="vertical", 
@@ -307,17 +454,8 @@ class MainWindow:
         parent.grid_columnconfigure(2, weight=0)
     
     def load_professions(self):
-        """加载职业数据"""
-        try:
-            with open("data/professions.json", 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.professions = data['professions']
-        except:
-            # 如果文件不存在，使用默认职业
-            self.professions = [
-                {"id": "engineer", "name": "工程师", "salary": 5000, 
-                 "initial_cash": 10000, "initial_expenses": 2500}
-            ]
+        """加载职业数据（与启动器共用player.professions中的加载函数）"""
+        self.professions = load_professions()
     
     def new_game(self):
         """开始新游戏"""
@@ -328,10 +466,14 @@ class MainWindow:
             
         # 创建游戏引擎
         self.game_engine = GameEngine(players_data)
+        self._reset_player_rows()
         success, message = self.game_engine.start_game()
         
         if success:
-            self.update_ui()
+            # 新游戏需要重绘整个棋盘
+            self._static_drawn = False
+            self._square_fills = {}
+            self.schedule_redraw()
             self.log_message("游戏开始！")
             # 更新调试模式玩家列表
             self.update_debug_player_list()
@@ -367,40 +509,44 @@ class MainWindow:
     
     def get_players_setup(self):
         """获取玩家设置"""
-        dialog = PlayerSetupDialog(self.root, self.professions)
-        self.root.wait_window(dialog.dialog)
+        # 每次打开时取最新的职业列表（加载结果有缓存），复用的对话框也随之更新
+        self.load_professions()
+        if self._setup_dialog is None:
+            self._setup_dialog = PlayerSetupDialog(self.root, self.professions)
+        else:
+            self._setup_dialog.show(self.professions)
+        dialog = self._setup_dialog
+        # 对话框关闭时只是隐藏，通过closed变量通知
+        self.root.wait_variable(dialog.closed)
         return dialog.result
     
     def roll_dice(self):
         """投骰子"""
-        if self.game_engine:
-            # 检查是否在调试模式且控制当前玩家
-            if (self.debug_mode_var.get() and 
-                self.game_engine.debug_mode and 
-                self.debug_player_combo.get()):
-                
-                # 获取选中的玩家索引
-                selected_text = self.debug_player_combo.get()
-                if selected_text:
-                    selected_index = int(selected_text.split('.')[0]) - 1
-                    current_index = self.game_engine.current_player_index
-                    
-                    # 如果选中的玩家是当前玩家，使用调试模式骰子点数
-                    if selected_index == current_index:
-                        debug_dice = self.debug_dice_var.get()
-                        success, message = self.game_engine.roll_dice_debug(debug_dice)
-                        if success:
-                            self.dice_label.config(text=f"🎲 {debug_dice} (调试)")
-                            self.log_message(f"{message} (调试模式)")
-                            self.update_ui()
-                        return
-            
-            # 正常投骰子
-            success, message = self.game_engine.roll_dice()
-            if success:
-                self.dice_label.config(text=f"🎲 {self.game_engine.current_dice_roll}")
-                self.log_message(message)
-                self.update_ui()
+        engine = self.game_engine
+        if not engine:
+            return
+        
+        # 检查是否在调试模式且控制当前玩家（每个Tk变量/控件只读取一次）
+        if self.debug_mode_var.get() and engine.debug_mode:
+            selected_text = self.debug_player_combo.get()
+            if selected_text:
+                # 获取选中的玩家索引，如果选中的玩家是当前玩家，使用调试模式骰子点数
+                selected_index = int(selected_text.split('.')[0]) - 1
+                if selected_index == engine.current_player_index:
+                    debug_dice = self.debug_dice_var.get()
+                    success, message = engine.roll_dice_debug(debug_dice)
+                    if success:
+                        self.dice_var.set(f"🎲 {debug_dice} (调试)")
+                        self.log_message(f"{message} (调试模式)")
+                        self.update_ui()
+                    return
+        
+        # 正常投骰子
+        success, message = engine.roll_dice()
+        if success:
+            self.dice_var.set(f"🎲 {engine.current_dice_roll}")
+            self.log_message(message)
+            self.update_ui()
     
     def move_player(self):
         """移动玩家"""
@@ -408,8 +554,7 @@ class MainWindow:
             success, message = self.game_engine.move_player()
             if success:
                 self.log_message(message)
-                self.update_ui()
-                self.draw_board()  # 重绘棋盘显示玩家位置
+                self.schedule_redraw()  # 刷新界面并重绘棋盘显示玩家位置
     
     def buy_card(self):
         """购买卡片"""
@@ -449,8 +594,7 @@ class MainWindow:
         success, message = self.game_engine.handle_layer_transition(target_layer)
         if success:
             self.log_message(message)
-            self.update_ui()
-            self.draw_board()  # 重绘棋盘显示玩家新位置
+            self.schedule_redraw()  # 刷新界面并重绘棋盘显示玩家新位置
     
     def end_turn(self):
         """结束回合"""
@@ -459,18 +603,39 @@ class MainWindow:
             if self.game_engine.turn_phase.value == "市场操作":
                 self.game_engine.handle_market_action("exit_market")
                 self.log_message("退出市场")
-                self.update_ui()
             
             success, message = self.game_engine.end_turn()
             if success:
                 self.log_message(message)
-                self.update_ui()
-                
+            # 退出市场和结束回合合并为一次刷新
+            self.update_ui()
+            
+            if success:
                 # 检查游戏是否结束
                 if self.game_engine.game_phase.value == "游戏结束":
                     messagebox.showinfo("游戏结束", message)
     
     def update_ui(self):
+        """请求刷新UI：同一轮事件中的多次请求合并为一次空闲时刷新"""
+        if self._ui_update_pending:
+            return
+        self._ui_update_pending = True
+        self.root.after_idle(self._run_pending_ui_update)
+    
+    def schedule_redraw(self):
+        """请求刷新UI并重绘棋盘，与update_ui共用同一次空闲回调"""
+        self._board_redraw_pending = True
+        self.update_ui()
+    
+    def _run_pending_ui_update(self):
+        """执行合并后的UI刷新（以及棋盘重绘）"""
+        self._ui_update_pending = False
+        self._do_update_ui()
+        if self._board_redraw_pending:
+            self._board_redraw_pending = False
+            self.draw_board()
+    
+    def _do_update_ui(self):
         """更新UI状态"""
         if not self.game_engine:
             return
@@ -479,7 +644,10 @@ class MainWindow:
         current_player = self.game_engine.get_current_player()
         phase = self.game_engine.turn_phase.value
         player_name = current_player.name if current_player else "无玩家"
-        self.status_label.config(text=f"{player_name} - {phase}")
+        status_text = f"{player_name} - {phase}"
+        if status_text != self._last_status_text:
+            self.status_var.set(status_text)
+            self._last_status_text = status_text
         
         # 更新按钮状态
         self.update_buttons()
@@ -496,79 +664,107 @@ class MainWindow:
             return
             
         phase = self.game_engine.turn_phase.value
+        if phase == self._last_phase:
+            return
+        self._last_phase = phase
         
-        # 根据游戏阶段启用/禁用按钮
-        self.roll_dice_btn.config(state="normal" if phase == "投骰子" else "disabled")
-        self.move_btn.config(state="normal" if phase == "移动" else "disabled")
-        self.end_turn_btn.config(state="normal" if phase == "结束回合" else "disabled")
-        
-        # 卡片决策按钮
-        card_decision = phase == "卡片决策"
-        self.buy_card_btn.config(state="normal" if card_decision else "disabled")
-        self.pass_card_btn.config(state="normal" if card_decision else "disabled")
-        
+        # 根据游戏阶段查表，只对状态发生变化的按钮调用config
         # 层级转换现在是自动的，不需要按钮
-        
-        # 市场操作：如果在市场阶段，允许直接结束回合
-        if phase == "市场操作":
-            self.end_turn_btn.config(state="normal")
+        states = PHASE_BUTTON_STATES.get(phase, _ALL_BUTTONS_DISABLED)
+        buttons = (self.roll_dice_btn, self.move_btn, self.end_turn_btn,
+                   self.buy_card_btn, self.pass_card_btn)
+        for button, state, last_state in zip(buttons, states, self._button_states):
+            if state != last_state:
+                button.config(state=state)
+        self._button_states = states
     
     def update_card_info(self):
         """更新卡片信息"""
-        if self.game_engine and self.game_engine.current_opportunity_card:
-            card = self.game_engine.current_opportunity_card
-            info = f"{card.name}\n{card.description}"
-            if hasattr(card, 'cost'):
-                info += f"\n成本: {card.cost}"
-            if hasattr(card, 'down_payment'):
-                info += f"\n首付: {card.down_payment}"
-            if hasattr(card, 'monthly_cash_flow'):
-                info += f"\n月现金流: {card.monthly_cash_flow}"
+        card = self.game_engine.current_opportunity_card if self.game_engine else None
+        # 卡片没有变化时连文本都不再重新拼接
+        if card is self._last_card:
+            return
+        self._last_card = card
+        
+        if card:
+            info = "\n".join([card.name, card.description, *card_display_lines(card)])
         else:
             info = "无"
         
-        self.card_info_label.config(text=info)
+        # 内容没有变化时不再重复设置标签
+        if info != self._last_card_info:
+            self.card_info_var.set(info)
+            self._last_card_info = info
+    
+    def _reset_player_rows(self):
+        """为当前游戏的每个玩家创建一行，之后只原地更新这些行"""
+        # 一次调用删除上一局的所有行
+        self.player_tree.delete(*self.player_tree.get_children())
+        self._player_row_ids = [self.player_tree.insert("", "end", text=player.name)
+                                for player in self.game_engine.players]
+        self._player_row_cache = [None] * len(self._player_row_ids)
+        self._player_rows_engine = self.game_engine
     
     def update_player_info(self):
         """更新玩家信息"""
-        # 清空现有数据
-        for item in self.player_tree.get_children():
-            self.player_tree.delete(item)
-        
         if not self.game_engine:
             return
         
-        # 添加玩家数据
-        for i, player in enumerate(self.game_engine.players):
+        # 游戏引擎不是经由new_game创建时（如启动器直接设置game_engine），在这里补建玩家行
+        if self._player_rows_engine is not self.game_engine:
+            self._reset_player_rows()
+        
+        # 更新玩家数据，内容没有变化的行直接跳过（循环中用到的方法先取到局部变量）
+        current_index = self.game_engine.current_player_index
+        row_cache = self._player_row_cache
+        set_row = self.player_tree.item
+        layer_short_name = LAYER_SHORT_NAMES.get
+        for i, (iid, player) in enumerate(zip(self._player_row_ids, self.game_engine.players)):
             name = player.name
-            if i == self.game_engine.current_player_index:
+            if i == current_index:
                 name += " (当前)"
             
             # 获取玩家所在层级
-            layer_name = getattr(player, "active_layer", "middle")
-            layer_display = {"inner": "内圈", "middle": "中圈", "outer": "外圈"}
-            layer_text = layer_display.get(layer_name, "中圈")
+            layer_text = layer_short_name(getattr(player, "active_layer", "middle"), "中圈")
             
-            values = (player.cash, player.passive_income, player.expenses, layer_text)
-            self.player_tree.insert("", "end", text=name, values=values)
+            row = (name, (player.cash, player.passive_income, player.expenses, layer_text))
+            if row != row_cache[i]:
+                set_row(iid, text=name, values=row[1])
+                row_cache[i] = row
             
         # 更新层级信息标签
         current_player = self.game_engine.get_current_player()
         if current_player:
-            layer_name = getattr(current_player, "active_layer", "middle")
-            layer_display = {"inner": "逆流层(内圈)", "middle": "平流层(中圈)", "outer": "顺流层(外圈)"}
-            self.layer_info_label.config(text=f"当前层级: {layer_display.get(layer_name, '平流层(中圈)')}")
+            layer_text = f"当前层级: {LAYER_FULL_NAMES.get(getattr(current_player, 'active_layer', 'middle'), '平流层(中圈)')}"
+            if layer_text != self._last_layer_text:
+                self.layer_info_var.set(layer_text)
+                self._last_layer_text = layer_text
     
     def draw_board(self):
-        """绘制游戏棋盘"""
-        self.board_canvas.delete("all")
+        """绘制游戏棋盘：静态部分只在首次、新游戏或画布尺寸变化时重绘，之后只移动玩家标记
         
-        # 更新canvas使其获取实际尺寸
-        self.board_canvas.update()
+        尺寸变化由<Configure>事件（_on_board_resize）负责让静态部分失效
+        """
+        if not self._static_drawn:
+            self._draw_static_board()
+            # 此时画布上只有静态元素，统一打上标签；没有游戏时格子尚未绘制，下次仍需重绘
+            self.board_canvas.addtag_all("static")
+            self._static_drawn = self.game_engine is not None
         
-        # 获取canvas尺寸，使用固定值避免0尺寸问题
-        canvas_width = max(self.board_canvas.winfo_width(), 600)
-        canvas_height = max(self.board_canvas.winfo_height(), 500)
+        if self.game_engine:
+            self._draw_player_tokens()
+    
+    def _draw_static_board(self):
+        """绘制棋盘的静态部分（圈层、连线、格子和编号）"""
+        self.board_canvas.delete("all")
+        self._player_tokens = {}
+        
+        # canvas尺寸优先使用<Configure>事件中缓存的值，画布尚未显示时才查询winfo，使用固定值避免0尺寸问题
+        if self._canvas_size is not None:
+            canvas_width, canvas_height = self._canvas_size
+        else:
+            canvas_width = max(self.board_canvas.winfo_width(), 600)
+            canvas_height = max(self.board_canvas.winfo_height(), 500)
         center_x = canvas_width // 2
         center_y = canvas_height // 2
         
@@ -601,11 +797,17 @@ class MainWindow:
         
         # 添加圈层标签
         self.board_canvas.create_text(center_x, center_y - outer_radius - 15, 
-                                  text="顺流层 (外圈)", font=("Arial", 10, "bold"), fill="blue")
+                                  text="顺流层 (外圈)", font=self._font_bold, fill="blue")
         self.board_canvas.create_text(center_x, center_y - middle_radius - 15, 
-                                  text="平流层 (中圈)", font=("Arial", 10, "bold"), fill="red")
+                                  text="平流层 (中圈)", font=self._font_bold, fill="red")
         self.board_canvas.create_text(center_x, center_y - inner_radius - 15, 
-                                  text="逆流层 (内圈)", font=("Arial", 10, "bold"), fill="green")
+                                  text="逆流层 (内圈)", font=self._font_bold, fill="green")
+        
+        self._board_geometry = {
+            "canvas_size": (canvas_width, canvas_height),
+            "center": (center_x, center_y),
+            "radius": {"inner": inner_radius, "middle": middle_radius, "outer": outer_radius}
+        }
         
         if not self.game_engine:
             # 没有游戏引擎，只绘制基础圆形
@@ -616,214 +818,157 @@ class MainWindow:
         middle_size = self.game_engine.board.get_circle_size("middle")
         outer_size = self.game_engine.board.get_circle_size("outer")
         
-        # 绘制三个圈的格子
-        layers = [
-            {"name": "outer", "radius": outer_radius, "size": outer_size, "color": "lightblue"},
-            {"name": "middle", "radius": middle_radius, "size": middle_size, "color": "red"},
-            {"name": "inner", "radius": inner_radius, "size": inner_size, "color": "green"}
-        ]
+        # 预先计算各层格子坐标，之后绘制格子和移动玩家只需查表
+        self._cell_xy = {
+            "outer": self._circle_cell_xy(center_x, center_y, outer_radius, outer_size),
+            "middle": self._circle_cell_xy(center_x, center_y, middle_radius, middle_size),
+            "inner": [(center_x + dx * inner_radius, center_y + dy * inner_radius)
+                      for dx, dy in self._Z_OFFSETS]
+        }
         
         # 绘制层级转换连线
         # 内圈位置1与中圈位置18绘制连线
-        inner_pos_1 = self.get_inner_layer_position(center_x, center_y, inner_radius, 1)
-        middle_pos_18_angle = 2 * 3.14159 * 18 / middle_size
-        middle_pos_18_x = center_x + middle_radius * cos(middle_pos_18_angle)
-        middle_pos_18_y = center_y + middle_radius * sin(middle_pos_18_angle)
+        inner_pos_1 = self._cell_xy["inner"][1]
+        middle_pos_18_x, middle_pos_18_y = self._cell_xy["middle"][18 % middle_size]
         
         # 绘制内圈1与中圈18之间的连线
         self.board_canvas.create_line(inner_pos_1[0], inner_pos_1[1], middle_pos_18_x, middle_pos_18_y, 
                                   fill="purple", width=2, dash=(4, 4))
         
         # 内圈位置9与中圈位置6绘制连线
-        inner_pos_9 = self.get_inner_layer_position(center_x, center_y, inner_radius, 9)
-        middle_pos_6_angle = 2 * 3.14159 * 6 / middle_size
-        middle_pos_6_x = center_x + middle_radius * cos(middle_pos_6_angle)
-        middle_pos_6_y = center_y + middle_radius * sin(middle_pos_6_angle)
+        inner_pos_9 = self._cell_xy["inner"][9]
+        middle_pos_6_x, middle_pos_6_y = self._cell_xy["middle"][6 % middle_size]
         
         # 绘制内圈9与中圈6之间的连线
         self.board_canvas.create_line(inner_pos_9[0], inner_pos_9[1], middle_pos_6_x, middle_pos_6_y, 
                                   fill="purple", width=2, dash=(4, 4))
         
-        # 绘制各层格子
-        for layer in layers:
-            layer_name = layer["name"]
-            radius = layer["radius"]
-            size = layer["size"]
-            color = layer["color"]
-            
+        # 绘制三个圈的格子（循环中反复使用的绑定方法先取到局部变量）
+        create_oval = self.board_canvas.create_oval
+        create_text = self.board_canvas.create_text
+        for layer_name, color in LAYER_OUTLINE_COLORS:
             if layer_name == "inner":
                 # 内层使用Z字形布局
-                self.draw_inner_layer_z_shape(center_x, center_y, inner_radius, size, color)
+                self.draw_inner_layer_z_shape(center_x, center_y, inner_radius, inner_size, color)
             else:
                 # 其他层使用圆形布局
-                for i in range(size):
-                    angle = 2 * 3.14159 * i / size
-                    x = center_x + radius * cos(angle)
-                    y = center_y + radius * sin(angle)
-                    
-                    # 获取格子类型
-                    square = self.game_engine.board.get_square(i, layer_name)
-                    
-                    # 根据格子类型选择颜色
-                    fill_color = self.game_engine.board.get_square_color(square.type) if square else "white"
-                    
+                cells = self._cell_xy[layer_name]
+                fills = self._layer_square_fills(layer_name, len(cells))
+                for (x, y), fill_color, label in zip(cells, fills, _cell_labels(len(cells))):
                     # 绘制格子
-                    self.board_canvas.create_oval(x-15, y-15, x+15, y+15, 
-                                              fill=fill_color, outline=color)
+                    create_oval(x-15, y-15, x+15, y+15, fill=fill_color, outline=color)
                     
                     # 绘制格子编号
-                    self.board_canvas.create_text(x, y, text=str(i))
+                    create_text(x, y, text=label)
+    
+    def _layer_square_fills(self, layer_name, count):
+        """按格子类型得到某一圈层前count个格子的填充颜色（每局游戏只查询一次）"""
+        fills = self._square_fills.get(layer_name)
+        if fills is None:
+            board = self.game_engine.board
+            fills = []
+            for i in range(count):
+                square = board.get_square(i, layer_name)
+                fills.append(board.get_square_color(square.type) if square else "white")
+            self._square_fills[layer_name] = fills
+        return fills
+    
+    @staticmethod
+    def _circle_cell_xy(center_x, center_y, radius, size):
+        """计算圆形布局中每个格子的中心坐标（查单位圆表后缩放平移，不再调用三角函数）"""
+        return [(center_x + radius * c, center_y + radius * s) for c, s in _unit_circle(size)]
+    
+    def _draw_player_tokens(self):
+        """绘制/移动玩家标记：已有标记只更新坐标，不重新创建；位置没变的玩家直接跳过"""
+        tokens = self._player_tokens
         
-        # 绘制玩家位置
         for i, player in enumerate(self.game_engine.players):
-            # 确定玩家所在圈层
+            # 确定玩家所在圈层，内层使用Z字形坐标，其他层使用圆形坐标
             player_layer = getattr(player, "active_layer", "middle")
+            if player_layer != "inner" and player_layer != "outer":
+                player_layer = "middle"
+            place = (player_layer, player.position)
+            token = tokens.get(i)
+            if token is not None and token[2] == place:
+                continue
             
-            if player_layer == "inner":
-                # 内层使用Z字形坐标
-                x, y = self.get_inner_layer_position(center_x, center_y, inner_radius, player.position)
-            else:
-                # 其他层使用圆形坐标
-                # 根据圈层选择半径
-                if player_layer == "outer":
-                    radius = outer_radius
-                    size = outer_size
-                else:  # middle
-                    radius = middle_radius
-                    size = middle_size
-                    
-                # 计算角度和位置
-                angle = 2 * 3.14159 * player.position / size
-                x = center_x + radius * cos(angle)
-                y = center_y + radius * sin(angle)
+            cells = self._cell_xy[player_layer]
             
-            # 玩家标记
-            player_colors = ["red", "green", "blue", "yellow", "purple", "orange"]
-            color = player_colors[i % len(player_colors)]
-            
-            self.board_canvas.create_oval(x-8, y-8, x+8, y+8, 
-                                      fill=color, outline="black")
-            self.board_canvas.create_text(x, y, text=str(i+1), fill="white")
-    
-    def get_inner_layer_position(self, center_x, center_y, inner_radius, position):
-        """获取内层Z字形指定位置的坐标"""
-        # Z字形路径的坐标点 (和draw_inner_layer_z_shape方法中的一致)
-        z_positions = [
-            # 空占位，因为我们从1开始编号
-            (0, 0),  # 0: 不使用
-            
-            # 第一行：1-4 (从左到右)
-            (-inner_radius * 0.6, -inner_radius * 0.4),  # 1: 左上
-            (-inner_radius * 0.2, -inner_radius * 0.4),  # 2
-            (inner_radius * 0.2, -inner_radius * 0.4),   # 3
-            (inner_radius * 0.6, -inner_radius * 0.4),   # 4: 右上
-            
-            # 中间：5 (星号* - 转换点)
-            (0, 0),                                     # 5: 中心点
+            if player.position < len(cells):
+                x, y = cells[player.position]
+            elif player_layer == "inner":
+                # 内层位置超出范围时放在中心点
+                x, y = self._board_geometry["center"]
+            else:
+                x, y = cells[player.position % len(cells)]
             
-            # 第二行：6-9 (从左到右)
-            (-inner_radius * 0.6, inner_radius * 0.4),   # 6: 左下
-            (-inner_radius * 0.2, inner_radius * 0.4),   # 7
-            (inner_radius * 0.2, inner_radius * 0.4),    # 8
-            (inner_radius * 0.6, inner_radius * 0.4),    # 9: 右下
-        ]
-        
-        if 0 <= position < len(z_positions):
-            x_offset, y_offset = z_positions[position]
-            return center_x + x_offset, center_y + y_offset
-        else:
-            # 如果位置超出范围，返回中心点
-            return center_x, center_y
+            if token is not None:
+                oval_id, text_id, _ = token
+                self.board_canvas.coords(oval_id, x-8, y-8, x+8, y+8)
+                self.board_canvas.coords(text_id, x, y)
+            else:
+                # 玩家标记
+                color = PLAYER_COLORS[i % len(PLAYER_COLORS)]
+                oval_id = self.board_canvas.create_oval(x-8, y-8, x+8, y+8, 
+                                                        fill=color, outline="black", tags="player")
+                text_id = self.board_canvas.create_text(x, y, text=str(i+1), fill="white", tags="player")
+            # (椭圆id, 编号id, 上次绘制时的(圈层, 位置))
+            tokens[i] = (oval_id, text_id, place)
     
     def draw_inner_layer_z_shape(self, center_x, center_y, inner_radius, size, color):
         """绘制内层Z字形格子布局"""
-        # Z字形路径的坐标点 (相对于中心点的偏移)
-        # 新布局: 
-        # 第一行: 1 2 3 4
-        # 中间: 5 (星号位置)
-        # 第二行: 6 7 8 9
-        z_positions = [
-            # 空占位，因为我们从1开始编号
-            (0, 0),  # 0: 不使用
-            
-            # 第一行：1-4 (从左到右)
-            (-inner_radius * 0.6, -inner_radius * 0.4),  # 1: 左上
-            (-inner_radius * 0.2, -inner_radius * 0.4),  # 2
-            (inner_radius * 0.2, -inner_radius * 0.4),   # 3
-            (inner_radius * 0.6, -inner_radius * 0.4),   # 4: 右上
-            
-            # 中间：5 (星号* - 转换点)
-            (0, 0),                                     # 5: 中心点
-            
-            # 第二行：6-9 (从左到右)
-            (-inner_radius * 0.6, inner_radius * 0.4),   # 6: 左下
-            (-inner_radius * 0.2, inner_radius * 0.4),   # 7
-            (inner_radius * 0.2, inner_radius * 0.4),    # 8
-            (inner_radius * 0.6, inner_radius * 0.4),    # 9: 右下
-        ]
-        
-        # 连接线 - 首先连接1-4
-        for i in range(1, 4):
-            x1_offset, y1_offset = z_positions[i]
-            x2_offset, y2_offset = z_positions[i+1]
-            x1, y1 = center_x + x1_offset, center_y + y1_offset
-            x2, y2 = center_x + x2_offset, center_y + y2_offset
-            
-            self.board_canvas.create_line(x1, y1, x2, y2, fill=color, width=2)
-        
-        # 连接线 - 连接4到5
-        x1_offset, y1_offset = z_positions[4]
-        x2_offset, y2_offset = z_positions[5]
-        x1, y1 = center_x + x1_offset, center_y + y1_offset
-        x2, y2 = center_x + x2_offset, center_y + y2_offset
-        self.board_canvas.create_line(x1, y1, x2, y2, fill=color, width=2)
-        
-        # 连接线 - 连接5到6
-        x1_offset, y1_offset = z_positions[5]
-        x2_offset, y2_offset = z_positions[6]
-        x1, y1 = center_x + x1_offset, center_y + y1_offset
-        x2, y2 = center_x + x2_offset, center_y + y2_offset
-        self.board_canvas.create_line(x1, y1, x2, y2, fill=color, width=2)
-        
-        # 连接线 - 连接6-9
-        for i in range(6, 9):
-            x1_offset, y1_offset = z_positions[i]
-            x2_offset, y2_offset = z_positions[i+1]
-            x1, y1 = center_x + x1_offset, center_y + y1_offset
-            x2, y2 = center_x + x2_offset, center_y + y2_offset
-            
-            self.board_canvas.create_line(x1, y1, x2, y2, fill=color, width=2)
+        # 各格子的绝对坐标已在_draw_static_board中按当前中心点和半径算好
+        z_xy = self._cell_xy["inner"]
+        
+        # 连接线：上半段1→2→3→4→5、下半段5→6→7→8→9，各用一条折线绘制
+        self.board_canvas.create_line(*[c for xy in z_xy[1:6] for c in xy], fill=color, width=2)
+        self.board_canvas.create_line(*[c for xy in z_xy[5:10] for c in xy], fill=color, width=2)
         
         # 绘制格子 - 跳过索引0，从1开始
-        for i in range(1, min(size + 1, len(z_positions))):
-            x_offset, y_offset = z_positions[i]
-            x = center_x + x_offset
-            y = center_y + y_offset
-            
-            # 获取格子类型
-            square = self.game_engine.board.get_square(i, "inner")
-            
-            # 根据格子类型选择颜色
-            fill_color = self.game_engine.board.get_square_color(square.type) if square else "white"
+        count = min(size + 1, len(z_xy))
+        fills = self._layer_square_fills("inner", count)
+        labels = _cell_labels(count)
+        create_oval = self.board_canvas.create_oval
+        create_text = self.board_canvas.create_text
+        for i in range(1, count):
+            x, y = z_xy[i]
             
             # 为星号格子(5)添加特殊标记
             if i == 5:
-                fill_color = "gold"
-                
-            # 绘制格子
-            self.board_canvas.create_oval(x-15, y-15, x+15, y+15, 
-                                      fill=fill_color, outline=color, width=2)
-            
-            # 绘制格子编号
-            if i == 5:
-                self.board_canvas.create_text(x, y, text="★", font=("Arial", 12, "bold"))
+                create_oval(x-15, y-15, x+15, y+15, fill="gold", outline=color, width=2)
+                create_text(x, y, text="★", font=self._font_star)
             else:
-                self.board_canvas.create_text(x, y, text=str(i), font=("Arial", 10, "bold"))
+                create_oval(x-15, y-15, x+15, y+15, fill=fills[i], outline=color, width=2)
+                create_text(x, y, text=labels[i], font=self._font_bold)
     
     def log_message(self, message):
-        """添加日志消息"""
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
+        """添加日志消息（先进入缓冲区，稍后统一写入）"""
+        self._log_pending.append(message + "\n")
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(self.LOG_FLUSH_DELAY_MS, self._flush_log)
+    
+    def _flush_log(self):
+        """把缓冲区中的日志一次性写入文本框，超过LOG_MAX_LINES时从顶部裁掉最旧的行"""
+        self._log_flush_scheduled = False
+        if not self._log_pending:
+            return
+        joined = "".join(self._log_pending)
+        self._log_pending.clear()
+        
+        at_bottom = self.log_text.yview()[1] >= 0.999
+        self.log_text.insert(tk.END, joined)
+        self._log_line_count += joined.count("\n")
+        
+        overflow = self._log_line_count - self.LOG_MAX_LINES
+        if overflow > 0:
+            # 删除可见区域上方的行时Tk会保持当前可见内容不变，无需恢复视图位置
+            self.log_text.delete("1.0", f"{overflow + 1}.0")
+            self._log_line_count = self.LOG_MAX_LINES
+        
+        # 只有原本就停在底部时才自动滚动
+        if at_bottom:
+            self.log_text.see("tail")
     
     def save_game(self):
         """保存游戏"""
@@ -835,33 +980,7 @@ class MainWindow:
     
     def show_rules(self):
         """显示游戏规则"""
-        rules = """
-财富流游戏规则:
-
-1. 游戏目标：通过投资和理财达到财务自由（被动收入 >= 支出）
-
-2. 游戏流程：
-   - 投骰子移动
-   - 执行格子事件
-   - 根据情况购买投资机会
-   - 管理资产和负债
-
-3. 格子类型：
-   - 发薪水：收取工资和被动收入，支付支出
-   - 机会：抽取投资机会卡片
-   - 意外支出：遇到突发费用
-   - 市场：可以买卖资产
-   - 慈善：根据孩子数量获得奖励
-   - 裁员：暂时失去工资收入
-   - 生孩子：增加支出但有慈善收益
-
-4. 卡片类型：
-   - 企业卡：高投入高回报的企业投资
-   - 机会卡：各种房地产和商业投资
-   - 金融卡：股票、基金等金融产品
-   - 副业卡：小投入快回报的副业
-        """
-        messagebox.showinfo("游戏规则", rules)
+        messagebox.showinfo("游戏规则", RULES_TEXT)
     
     def show_income_statement(self):
         """显示当前玩家的损益表"""
@@ -1120,16 +1239,7 @@ class MainWindow:
     
     def show_about(self):
         """显示关于信息"""
-        about = """
-财富流游戏 v1.0
-
-基于《富爸爸穷爸爸》理念的财务教育游戏
-帮助玩家学习投资和理财知识
-
-开发者：AI助手
-框架：Python + Tkinter
-        """
-        messagebox.showinfo("关于", about)
+        messagebox.showinfo("关于", ABOUT_TEXT)
     
     def run(self):
         """运行应用"""
@@ -1148,9 +1258,27 @@ class PlayerSetupDialog:
         self.dialog.geometry("400x300")
         self.dialog.transient(parent)
         self.dialog.grab_set()
+        # 点窗口关闭按钮等同于取消，对话框只隐藏不销毁，方便重复使用
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel_clicked)
+        self.closed = tk.BooleanVar(self.dialog, value=False)
         
         self.setup_dialog()
     
+    def show(self, professions):
+        """用当前的职业列表重新显示已创建的对话框，并恢复默认的玩家数量"""
+        self.professions = professions
+        self.result = None
+        self.closed.set(False)
+        self.player_spinbox.set(2)
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+    
+    def _close(self):
+        """隐藏对话框并通知等待方"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self.closed.set(True)
+    
     def setup_dialog(self):
         """设置对话框"""
         main_frame = ttk.Frame(self.dialog, padding="10")
@@ -1158,9 +1286,10 @@ class PlayerSetupDialog:
         
         # 玩家数量
         ttk.Label(main_frame, text="玩家数量:").grid(row=0, column=0, sticky="w", pady=5)
-        self.player_count = tk.IntVar(value=2)
-        player_spinbox = ttk.Spinbox(main_frame, from_=2, to=6, textvariable=self.player_count)
-        player_spinbox.grid(row=0, column=1, sticky="ew", pady=5)
+        # 不绑定IntVar，点击确定时直接读取控件的值
+        self.player_spinbox = ttk.Spinbox(main_frame, from_=2, to=6)
+        self.player_spinbox.set(2)
+        self.player_spinbox.grid(row=0, column=1, sticky="ew", pady=5)
         
         # 按钮
         btn_frame = ttk.Frame(main_frame)
@@ -1173,36 +1302,26 @@ class PlayerSetupDialog:
     
     def ok_clicked(self):
         """确定按钮点击"""
-        count = self.player_count.get()
-        self.result = []
-        
-        for i in range(count):
-            # 简单设置，使用默认职业
-            profession = self.professions[i % len(self.professions)]
-            player_data = {
-                'name': f"玩家{i+1}",
-                'profession': profession['name'],
-                'salary': profession['salary'],
-                'cash': profession['initial_cash'],
-                'expenses': profession['initial_expenses']
-            }
-            self.result.append(player_data)
-        
-        self.dialog.destroy()
+        try:
+            count = min(max(int(self.player_spinbox.get()), 2), 6)
+        except ValueError:
+            # 输入的不是整数时使用默认的2名玩家
+            count = 2
+        
+        # 简单设置，按顺序循环使用职业
+        self.result = [{
+            'name': f"玩家{i+1}",
+            'profession': profession['name'],
+            'salary': profession['salary'],
+            'cash': profession['initial_cash'],
+            'expenses': profession['initial_expenses']
+        } for i, profession in enumerate(islice(cycle(self.professions), count))]
+        
+        self._close()
     
     def cancel_clicked(self):
         """取消按钮点击"""
         self.result = None
-        self.dialog.destroy()
-
-
-# 数学函数
-def cos(angle):
-    """余弦函数"""
-    import math
-    return math.cos(angle)
+        self._close()
 
-def sin(angle):
-    """正弦函数"""
-    import math
-    return math.sin(angle) 
\ No newline at end of file
+ 
\ No newline at end of file